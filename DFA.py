@@ -1,4 +1,5 @@
-from graphviz import Digraph
+import sys
+import time
 
 def escape_label(label):
     """
@@ -16,12 +17,61 @@ def escape_label(label):
         .replace("}", "\\}")
     )
 
+class StateExplosionError(Exception):
+    def __init__(self, stage, limit, maximum, observed):
+        """
+        Se lanza cuando la construcción de un autómata supera uno de los
+        límites de CompileLimits:
+          - stage: etapa en la que ocurrió ("subset construction" o "minimization").
+          - limit: nombre del límite superado (por ejemplo "max_states").
+          - maximum: valor configurado del límite.
+          - observed: valor alcanzado.
+        """
+        super().__init__(f"{stage}: {limit} exceeded ({observed} > {maximum})")
+        self.stage = stage
+        self.limit = limit
+        self.maximum = maximum
+        self.observed = observed
+
+class CompileLimits:
+    def __init__(self, max_states=None, max_transitions=None, max_memory=None, max_time=None):
+        """
+        Presupuesto de construcción de un autómata. Cada límite es opcional (None = sin límite):
+          - max_states: número máximo de estados del DFA.
+          - max_transitions: número máximo de transiciones del DFA.
+          - max_memory: estimación en bytes de los estados y tablas de transición.
+          - max_time: segundos por etapa (construcción por subconjuntos y minimización).
+        Los cuatro límites se comprueban en ambas etapas; la memoria de la
+        construcción por subconjuntos incluye followpos.
+        """
+        self.max_states = max_states
+        self.max_transitions = max_transitions
+        self.max_memory = max_memory
+        self.max_time = max_time
+
+    def check(self, stage, started, states=0, transitions=0, memory=0):
+        """
+        Lanza StateExplosionError si alguno de los valores observados supera su límite.
+        """
+        for limit, observed in (("max_states", states), ("max_transitions", transitions),
+                                ("max_memory", memory)):
+            maximum = getattr(self, limit)
+            if maximum is not None and observed > maximum:
+                raise StateExplosionError(stage, limit, maximum, observed)
+        if self.max_time is not None:
+            elapsed = time.perf_counter() - started
+            if elapsed > self.max_time:
+                raise StateExplosionError(stage, "max_time", self.max_time, round(elapsed, 3))
+
 class DFA:
-    def __init__(self, syntax_tree):
+    def __init__(self, syntax_tree, limits=None):
         """
         Recibe un objeto SyntaxTree (definido en arbolSINT.py) y construye
         el DFA mediante el método directo (usando nullable, firstpos, lastpos y followpos).
+        Si se indica `limits` (CompileLimits), la construcción por subconjuntos
+        lanza StateExplosionError en cuanto se supera el presupuesto.
         """
+        self.limits = limits
         self.followpos = {}       
         self.pos_to_symbol = {}   
         pos_counter = [1]         
@@ -37,50 +87,61 @@ class DFA:
                 break
         self.build_dfa()
 
-    def compute_functions(self, node, followpos, pos_to_symbol, pos_counter):
+    @staticmethod
+    def compute_functions(node, followpos, pos_to_symbol, pos_counter):
         """
-        Función recursiva que computa para cada nodo del árbol:
+        Computa para cada nodo del árbol:
           - nullable: True si la subexpresión puede ser ε.
           - firstpos: conjunto de posiciones (números de hoja) que pueden aparecer al inicio.
           - lastpos: conjunto de posiciones que pueden aparecer al final.
         
         Además, asigna números de posición a cada hoja (excepto ε) y actualiza followpos.
+        El recorrido es postorden con una pila explícita, de modo que los árboles
+        profundos no provocan RecursionError; los resultados de los hijos se
+        apilan en `results` y cada operador consume los suyos.
         """
-        if node.left is None and node.right is None:
-            if node.value == "ε":
-                return (True, set(), set())
+        results = []
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if current.left is None and current.right is None:
+                if current.value == "ε":
+                    results.append((True, set(), set()))
+                else:
+                    pos = pos_counter[0]
+                    pos_counter[0] += 1
+                    current.pos = pos  
+                    pos_to_symbol[pos] = current.value
+                    results.append((False, {pos}, {pos}))
+            elif not visited:
+                stack.append((current, True))
+                if current.right is not None:
+                    stack.append((current.right, False))
+                stack.append((current.left, False))
+            elif current.value == '|':
+                right_nullable, right_firstpos, right_lastpos = results.pop()
+                left_nullable, left_firstpos, left_lastpos = results.pop()
+                nullable = left_nullable or right_nullable
+                firstpos = left_firstpos.union(right_firstpos)
+                lastpos = left_lastpos.union(right_lastpos)
+                results.append((nullable, firstpos, lastpos))
+            elif current.value == '·':
+                right_nullable, right_firstpos, right_lastpos = results.pop()
+                left_nullable, left_firstpos, left_lastpos = results.pop()
+                nullable = left_nullable and right_nullable
+                firstpos = left_firstpos.union(right_firstpos) if left_nullable else left_firstpos
+                lastpos = left_lastpos.union(right_lastpos) if right_nullable else right_lastpos
+                for pos in left_lastpos:
+                    followpos.setdefault(pos, set()).update(right_firstpos)
+                results.append((nullable, firstpos, lastpos))
+            elif current.value == '*':
+                child_nullable, child_firstpos, child_lastpos = results.pop()
+                for pos in child_lastpos:
+                    followpos.setdefault(pos, set()).update(child_firstpos)
+                results.append((True, child_firstpos, child_lastpos))
             else:
-                pos = pos_counter[0]
-                pos_counter[0] += 1
-                node.pos = pos  
-                pos_to_symbol[pos] = node.value
-                return (False, {pos}, {pos})
-        elif node.value == '|':
-            left_nullable, left_firstpos, left_lastpos = self.compute_functions(node.left, followpos, pos_to_symbol, pos_counter)
-            right_nullable, right_firstpos, right_lastpos = self.compute_functions(node.right, followpos, pos_to_symbol, pos_counter)
-            nullable = left_nullable or right_nullable
-            firstpos = left_firstpos.union(right_firstpos)
-            lastpos = left_lastpos.union(right_lastpos)
-            return (nullable, firstpos, lastpos)
-        elif node.value == '·':
-            left_nullable, left_firstpos, left_lastpos = self.compute_functions(node.left, followpos, pos_to_symbol, pos_counter)
-            right_nullable, right_firstpos, right_lastpos = self.compute_functions(node.right, followpos, pos_to_symbol, pos_counter)
-            nullable = left_nullable and right_nullable
-            firstpos = left_firstpos.union(right_firstpos) if left_nullable else left_firstpos
-            lastpos = left_lastpos.union(right_lastpos) if right_nullable else right_lastpos
-            for pos in left_lastpos:
-                followpos.setdefault(pos, set()).update(right_firstpos)
-            return (nullable, firstpos, lastpos)
-        elif node.value == '*':
-            child_nullable, child_firstpos, child_lastpos = self.compute_functions(node.left, followpos, pos_to_symbol, pos_counter)
-            nullable = True
-            firstpos = child_firstpos
-            lastpos = child_lastpos
-            for pos in child_lastpos:
-                followpos.setdefault(pos, set()).update(child_firstpos)
-            return (nullable, firstpos, lastpos)
-        else:
-            raise Exception("Operador no soportado en la construcción del DFA: " + node.value)
+                raise Exception("Operador no soportado en la construcción del DFA: " + current.value)
+        return results.pop()
 
     def build_dfa(self):
         """
@@ -88,6 +149,15 @@ class DFA:
         Cada estado es un conjunto (frozenset) de posiciones.
         Se generan las transiciones y se determinan los estados finales.
         """
+        limits = self.limits
+        started = time.perf_counter()
+        transition_count = 0
+        memory = 0
+        if limits is not None:
+            # followpos puede crecer cuadráticamente con el número de posiciones.
+            memory = sys.getsizeof(self.followpos) + sum(
+                sys.getsizeof(positions) for positions in self.followpos.values())
+            limits.check("subset construction", started, 1, 0, memory)
         self.transitions = {}   
         self.final_states = set()
         unmarked_states = []
@@ -114,6 +184,13 @@ class DFA:
                 if next_state not in dfa_states:
                     dfa_states[next_state] = True
                     unmarked_states.append(next_state)
+                    if limits is not None:
+                        memory += sys.getsizeof(next_state)
+            if limits is not None:
+                transition_count += len(self.transitions[state])
+                memory += sys.getsizeof(self.transitions[state])
+                limits.check("subset construction", started, len(dfa_states),
+                             transition_count, memory)
         for state in dfa_states:
             if self.eof_position is not None and self.eof_position in state:
                 self.final_states.add(state)
@@ -121,7 +198,11 @@ class DFA:
     def visualize(self, filename='dfa'):
         """
         Genera y guarda la visualización del DFA usando Graphviz.
+        graphviz se importa aquí y no al cargar el módulo, de modo que
+        compilar y simular no requiere tenerlo instalado.
         """
+        from graphviz import Digraph
+
         dot = Digraph(comment='DFA')
         state_ids = {}
         counter = 0
@@ -1,5 +1,6 @@
+import sys
+import time
 from DFA import DFA
-from graphviz import Digraph
 
 def escape_label(label):
     """
@@ -14,11 +15,16 @@ def escape_label(label):
     )
 
 class MinimizedDFA:
-    def __init__(self, dfa: DFA):
+    def __init__(self, dfa: DFA, limits=None):
         """
         Recibe un objeto DFA (con transiciones, estados finales, etc.)
         y construye la versión minimizada mediante el algoritmo de partición.
+        Si se indica `limits` (CompileLimits), el refinamiento lanza
+        StateExplosionError cuando el número de bloques de la partición, las
+        transiciones del DFA, la memoria de los bloques o el tiempo superan
+        su límite.
         """
+        started = time.perf_counter()
         self.original_dfa = dfa
         self.start_state = dfa.start_state
         self.transitions = dfa.transitions
@@ -40,7 +46,12 @@ class MinimizedDFA:
             if state in self.transitions:
                 for sym in self.transitions[state]:
                     alphabet.add(sym)
+        if limits is not None:
+            transition_count = sum(len(self.transitions.get(state, ())) for state in self.states)
         while W:
+            if limits is not None:
+                limits.check("minimization", started, len(P), transition_count,
+                             self._partition_memory(P, W))
             A = W.pop()
             for c in alphabet:
                 X = set()
@@ -92,6 +103,16 @@ class MinimizedDFA:
                             break
         self.eof_symbol = dfa.eof_symbol
 
+    @staticmethod
+    def _partition_memory(P, W):
+        """
+        Estimación en bytes de los bloques de la partición y de la lista de
+        trabajo.
+        """
+        return (sys.getsizeof(P) + sys.getsizeof(W)
+                + sum(sys.getsizeof(block) for block in P)
+                + sum(sys.getsizeof(block) for block in W))
+
     def _get_reachable_states(self):
         """
         Obtiene el conjunto de estados alcanzables desde el estado inicial.
@@ -112,6 +133,8 @@ class MinimizedDFA:
         """
         Genera y guarda la visualización del DFA minimizado usando Graphviz.
         """
+        from graphviz import Digraph
+
         dot = Digraph(comment='Minimized DFA')
         state_ids = {}
         counter = 0
@@ -1,19 +1,22 @@
-from graphviz import Digraph
 from symbol import Symbol
 
 EOF_SYMBOL = '☒'
 
 class TreeNode:
+    __slots__ = ('value', 'left', 'right', 'pos')
+
     def __init__(self, value, left=None, right=None):
         """
         Cada nodo tiene:
           - value: el símbolo (operador o literal)
           - left: hijo izquierdo (para operadores unarios o binarios)
           - right: hijo derecho (solo para operadores binarios)
+          - pos: número de posición asignado a las hojas al construir el DFA
         """
         self.value = value
         self.left = left
         self.right = right
+        self.pos = None
 
 class SyntaxTree:
     def __init__(self, tokens):
@@ -64,6 +67,8 @@ class SyntaxTree:
         Genera la imagen del árbol sintáctico usando Graphviz.
         Se crea un archivo (por ejemplo, syntax_tree.png).
         """
+        from graphviz import Digraph
+
         dot = Digraph(comment='Árbol Sintáctico')
         self._add_nodes(dot, self.root, counter=[0])
         dot.render(filename, format='png', cleanup=True)
@@ -0,0 +1,162 @@
+import importlib.util
+import os
+import re
+
+HEADER = "# Matcher generado automáticamente a partir de un MinimizedDFA. No editar.\n"
+
+def number_states(min_dfa):
+    """
+    Asigna un número entero a cada estado del DFA minimizado recorriéndolo
+    en anchura desde el estado inicial (que recibe el 0). El orden de los
+    símbolos es el lexicográfico, de modo que la numeración es determinista.
+    """
+    transitions = min_dfa.minimized_transitions
+    numbers = {min_dfa.minimized_start: 0}
+    order = [min_dfa.minimized_start]
+    index = 0
+    while index < len(order):
+        state = order[index]
+        index += 1
+        for sym in sorted(transitions.get(state, {})):
+            target = transitions[state][sym]
+            if target not in numbers:
+                numbers[target] = len(order)
+                order.append(target)
+    return numbers, order
+
+def _membership(var, chars):
+    if len(chars) == 1:
+        return f"{var} == {chars[0]!r}"
+    return f"{var} in {{{', '.join(repr(c) for c in chars)}}}"
+
+LEAF_STATES = 4
+TABLE_TARGETS = 8
+
+def _state_body(name, number, transitions, numbers, state, finals, prelude):
+    """
+    Líneas (sin sangría base) que procesan el carácter `c` en un estado.
+    """
+    body = []
+    by_target = {}
+    loop_chars = []
+    for sym in sorted(transitions.get(state, {})):
+        target = transitions[state][sym]
+        if target == state:
+            loop_chars.append(sym)
+        else:
+            by_target.setdefault(numbers[target], []).append(sym)
+    if loop_chars:
+        skip = f"_{name}_skip_{number}"
+        char_class = "".join(re.escape(c) for c in loop_chars)
+        prelude.append(f"{skip} = re.compile({'[' + char_class + ']*'!r}).match")
+        at_end = "True" if number in finals else "False"
+        body.append(f"if {_membership('c', loop_chars)}:")
+        body.append(f"    if i + 1 < n and {_membership('s[i + 1]', loop_chars)}:")
+        body.append(f"        i = {skip}(s, i).end()")
+        body.append("        if i == n:")
+        body.append(f"            return {at_end}")
+        body.append("        c = s[i]")
+        body.append("    else:")
+        body.append("        i += 1")
+        body.append("        continue")
+    if len(by_target) > TABLE_TARGETS:
+        table = f"_{name}_next_{number}"
+        entries = ", ".join(f"{sym!r}: {target}" for target in sorted(by_target)
+                            for sym in by_target[target])
+        prelude.append(f"{table} = {{{entries}}}")
+        body.append(f"state = {table}.get(c, -1)")
+        body.append("if state < 0:")
+        body.append("    return False")
+        return body
+    branch = "if"
+    for target in sorted(by_target):
+        body.append(f"{branch} {_membership('c', by_target[target])}:")
+        body.append(f"    state = {target}")
+        branch = "elif"
+    if branch == "if":
+        body.append("return False")
+    else:
+        body.append("else:")
+        body.append("    return False")
+    return body
+
+def generate_source(min_dfa, name="match"):
+    """
+    Genera el código fuente de una función `name(s)` especializada para el
+    DFA minimizado dado:
+      - el estado es un entero local; el estado actual se localiza con un
+        árbol de if balanceado sobre los números de estado (bloques de hasta
+        LEAF_STATES estados en un if/elif), de modo que el costo por carácter
+        crece con el logaritmo del número de estados y no linealmente;
+      - las transiciones de un estado se agrupan por estado destino; si hay
+        más de TABLE_TARGETS destinos se usa un diccionario carácter → estado;
+      - los estados con ciclos sobre sí mismos saltan la racha completa de
+        caracteres del ciclo con una búsqueda precompilada (re.match de la
+        clase, que recorre la cadena en C) cuando los dos caracteres
+        siguientes pertenecen al ciclo (las rachas de un carácter cuestan
+        menos por el despacho normal), y solo retoman el despacho carácter
+        a carácter en el carácter de salida.
+    """
+    numbers, order = number_states(min_dfa)
+    transitions = min_dfa.minimized_transitions
+    finals = sorted(numbers[s] for s in order if s in min_dfa.minimized_final)
+    accepting = f"state in {{{', '.join(map(str, finals))}}}" if finals else "False"
+
+    prelude = []
+    bodies = [_state_body(name, numbers[state], transitions, numbers, state, finals, prelude)
+              for state in order]
+    lines = [f"def {name}(s):", "    state = 0", "    i = 0", "    n = len(s)",
+             "    while i < n:", "        c = s[i]"]
+    # Pila de rangos [lo, hi) de estados; los rangos grandes se parten por la
+    # mitad en un if/else y los pequeños se emiten como una cadena if/elif.
+    stack = [(0, len(order), 8, None)]
+    while stack:
+        lo, hi, indent, header = stack.pop()
+        pad = " " * indent
+        if header is not None:
+            lines.append(pad[:-4] + header)
+        if hi - lo <= LEAF_STATES:
+            for number in range(lo, hi):
+                if hi - lo > 1:
+                    keyword = "if" if number == lo else "elif"
+                    lines.append(f"{pad}{keyword} state == {number}:")
+                    inner = pad + "    "
+                else:
+                    inner = pad
+                lines.extend(inner + line for line in bodies[number])
+            continue
+        mid = (lo + hi) // 2
+        lines.append(f"{pad}if state < {mid}:")
+        stack.append((mid, hi, indent + 4, "else:"))
+        stack.append((lo, mid, indent + 4, None))
+    lines.append("        i += 1")
+    lines.append(f"    return {accepting}")
+    header = [HEADER, "import re", ""] + prelude + ["", ""]
+    return "\n".join(header + lines) + "\n"
+
+def compile_matcher(min_dfa, name="match"):
+    """
+    Compila con compile()/exec el código generado y retorna la función.
+    """
+    source = generate_source(min_dfa, name)
+    namespace = {}
+    exec(compile(source, f"<matcher {name}>", "exec"), namespace)
+    return namespace[name]
+
+def save_matcher(min_dfa, path, name="match"):
+    """
+    Escribe el matcher generado como un módulo .py que puede importarse
+    posteriormente (y cuyo bytecode Python guarda en __pycache__).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_source(min_dfa, name))
+
+def load_matcher(path, name="match"):
+    """
+    Importa un módulo guardado con save_matcher y retorna su función.
+    """
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
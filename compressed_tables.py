@@ -0,0 +1,240 @@
+from array import array
+from bisect import bisect_right
+from codegen import number_states
+
+FAIL = -1
+
+def transition_rows(min_dfa):
+    """
+    Retorna (rows, finals) para el DFA minimizado: rows[i] es un diccionario
+    punto de código → estado destino del estado i (numerado con
+    codegen.number_states, el inicial es el 0) y finals el conjunto de
+    estados finales.
+    """
+    numbers, order = number_states(min_dfa)
+    transitions = min_dfa.minimized_transitions
+    rows = []
+    for state in order:
+        rows.append({ord(sym): numbers[target]
+                     for sym, target in transitions.get(state, {}).items()})
+    finals = frozenset(numbers[s] for s in order if s in min_dfa.minimized_final)
+    return rows, finals
+
+class DenseTable:
+    kind = "dense"
+
+    def __init__(self, rows, finals):
+        """
+        Tabla densa de referencia: una fila por estado y una columna por
+        símbolo del alfabeto.
+        """
+        alphabet = sorted({cp for row in rows for cp in row})
+        self.columns = {cp: i for i, cp in enumerate(alphabet)}
+        self.width = len(alphabet)
+        self.table = array("i", [FAIL]) * (len(rows) * self.width)
+        for state, row in enumerate(rows):
+            for cp, target in row.items():
+                self.table[state * self.width + self.columns[cp]] = target
+        self.finals = finals
+
+    def cells(self):
+        return len(self.table)
+
+    def match(self, input_string):
+        columns = self.columns
+        table = self.table
+        width = self.width
+        state = 0
+        for ch in input_string:
+            column = columns.get(ord(ch))
+            if column is None:
+                return False
+            state = table[state * width + column]
+            if state < 0:
+                return False
+        return state in self.finals
+
+def equivalence_classes(rows):
+    """
+    Agrupa los puntos de código que tienen el mismo destino en todos los
+    estados (la misma columna de la tabla densa). Retorna un diccionario
+    punto de código → número de clase; las clases se numeran en el orden
+    del primer punto de código de cada una.
+    """
+    alphabet = sorted({cp for row in rows for cp in row})
+    signatures = {}
+    classes = {}
+    for cp in alphabet:
+        signature = tuple(row.get(cp, FAIL) for row in rows)
+        classes[cp] = signatures.setdefault(signature, len(signatures))
+    return classes
+
+class CombTable:
+    kind = "comb"
+
+    def __init__(self, rows, finals):
+        """
+        Compresión por desplazamiento de filas (comb): primero los puntos de
+        código se reemplazan por su clase de equivalencia (equivalence_classes),
+        de modo que las columnas son pocas y contiguas aunque el alfabeto tenga
+        puntos de código muy dispersos. Luego las filas se superponen en los
+        arreglos `next`/`check` indexados por base[estado] + clase, buscando
+        para cada fila el primer desplazamiento cuyas casillas estén libres.
+        Una casilla pertenece al estado si check coincide; en otro caso se
+        aplica la transición por defecto, que es de fallo (el DFA minimizado
+        no tiene estado de error explícito).
+        Las filas más pobladas se colocan primero para llenar mejor los huecos.
+        Como en DenseTable, el diccionario de columnas no cuenta en cells().
+        """
+        self.classes = equivalence_classes(rows)
+        class_rows = []
+        for row in rows:
+            class_row = {}
+            for cp, target in row.items():
+                class_row[self.classes[cp]] = target
+            class_rows.append(class_row)
+        self.base = array("i", [0]) * len(rows)
+        next_states = array("i")
+        check = array("i")
+        occupied = bytearray()
+        first_free = 0
+        for state in sorted(range(len(class_rows)), key=lambda s: -len(class_rows[s])):
+            row = class_rows[state]
+            if not row:
+                continue
+            low = min(row)
+            offsets = sorted(column - low for column in row)
+            start = first_free
+            while True:
+                # Salta en C hasta la siguiente casilla libre para el primer
+                # desplazamiento (que es 0) y comprueba solo las demás.
+                start = occupied.find(0, start)
+                if start < 0:
+                    start = len(occupied)
+                    break
+                if all(start + off >= len(occupied) or not occupied[start + off]
+                       for off in offsets):
+                    break
+                start += 1
+            end = start + offsets[-1] + 1
+            if end > len(occupied):
+                grow = end - len(occupied)
+                occupied.extend(bytes(grow))
+                next_states.extend([FAIL] * grow)
+                check.extend([FAIL] * grow)
+            for column, target in row.items():
+                index = start + column - low
+                occupied[index] = 1
+                next_states[index] = target
+                check[index] = state
+            self.base[state] = start - low
+            first_free = occupied.find(0, first_free)
+            if first_free < 0:
+                first_free = len(occupied)
+        self.next = next_states
+        self.check = check
+        self.finals = finals
+
+    def cells(self):
+        return len(self.base) + len(self.next) + len(self.check)
+
+    def match(self, input_string):
+        classes = self.classes
+        base = self.base
+        next_states = self.next
+        check = self.check
+        size = len(check)
+        state = 0
+        for ch in input_string:
+            column = classes.get(ord(ch))
+            if column is None:
+                return False
+            index = base[state] + column
+            if index < 0 or index >= size or check[index] != state:
+                return False
+            state = next_states[index]
+        return state in self.finals
+
+class IntervalTable:
+    kind = "intervals"
+
+    def __init__(self, rows, finals):
+        """
+        Cada estado guarda sus transiciones como intervalos [inicio, fin] de
+        puntos de código consecutivos con el mismo destino, ordenados por
+        inicio; la transición se busca con bisect. Es la representación más
+        compacta para clases amplias (por ejemplo rangos Unicode).
+        """
+        self.starts = []
+        self.ends = []
+        self.targets = []
+        for row in rows:
+            starts = array("i")
+            ends = array("i")
+            targets = array("i")
+            for cp in sorted(row):
+                target = row[cp]
+                if ends and ends[-1] == cp - 1 and targets[-1] == target:
+                    ends[-1] = cp
+                else:
+                    starts.append(cp)
+                    ends.append(cp)
+                    targets.append(target)
+            self.starts.append(starts)
+            self.ends.append(ends)
+            self.targets.append(targets)
+        self.finals = finals
+
+    def cells(self):
+        return sum(3 * len(starts) for starts in self.starts)
+
+    def match(self, input_string):
+        state = 0
+        for ch in input_string:
+            cp = ord(ch)
+            starts = self.starts[state]
+            i = bisect_right(starts, cp) - 1
+            if i < 0 or cp > self.ends[state][i]:
+                return False
+            state = self.targets[state][i]
+        return state in self.finals
+
+REPRESENTATIONS = {table.kind: table for table in (DenseTable, CombTable, IntervalTable)}
+
+def compress(min_dfa, policy="size"):
+    """
+    Construye una representación compacta de minimized_transitions según `policy`:
+      - "dense", "comb" o "intervals": usa esa representación.
+      - "speed": acceso O(1) por carácter; comb salvo que ocupe más casillas
+        que la tabla densa.
+      - "size": la de menos casillas entre dense, comb e intervals.
+    """
+    rows, finals = transition_rows(min_dfa)
+    if policy in REPRESENTATIONS:
+        return REPRESENTATIONS[policy](rows, finals)
+    if policy == "speed":
+        comb = CombTable(rows, finals)
+        dense = DenseTable(rows, finals)
+        return comb if comb.cells() <= dense.cells() else dense
+    if policy == "size":
+        candidates = [DenseTable(rows, finals), CombTable(rows, finals), IntervalTable(rows, finals)]
+        return min(candidates, key=lambda table: table.cells())
+    raise ValueError("Unknown compression policy: " + policy)
+
+def compression_stats(table, min_dfa):
+    """
+    Estadísticas de la tabla comprimida frente a la tabla densa equivalente
+    (una fila por estado y una columna por símbolo del alfabeto).
+    """
+    rows, _ = transition_rows(min_dfa)
+    alphabet = {cp for row in rows for cp in row}
+    dense_cells = len(rows) * len(alphabet)
+    cells = table.cells()
+    return {
+        "kind": table.kind,
+        "states": len(rows),
+        "transitions": sum(len(row) for row in rows),
+        "dense_cells": dense_cells,
+        "cells": cells,
+        "ratio": cells / dense_cells if dense_cells else 1.0,
+    }
@@ -0,0 +1,92 @@
+from preprocessor import preprocess_expression
+from parser import parse_regex, to_postfix
+from simplifier import simplify
+from symbol import Symbol
+from arbolSINT import SyntaxTree
+from DFA import DFA
+from MinimizedDFA import MinimizedDFA
+from prefilter import Prefilter
+from derivatives import DerivativeDFA
+
+def tokenize_postfix(postfix_str):
+    """
+    Convierte la cadena en notación postfix (tokens separados por espacios)
+    en una lista de objetos Symbol.
+    Se asume que:
+      - Los operadores son: *, |, ·, ? y +
+      - Los literales escapados se generan en el formato: lit(<carácter>)
+    """
+    tokens = postfix_str.split()
+    result = []
+    for token in tokens:
+        if token.startswith("lit(") and token.endswith(")"):
+            literal_char = token[4:-1]
+            result.append(Symbol(literal_char, "operand"))
+        elif token in {'*', '|', '·', '?', '+'}:
+            result.append(Symbol(token, "operator"))
+        else:
+            result.append(Symbol(token, "operand"))
+    return result
+
+def simulate_dfa(dfa_obj, input_string, minimized=False, prefilter=None):
+    """
+    Simula el DFA dado (original o minimizado) con la cadena de entrada.
+    
+    Se asume que el DFA fue construido sobre la expresión regular
+    concatenada con el símbolo EOF. Por ello, al simular la cadena de entrada
+    (sin agregar el EOF) se verifica que el estado resultante sea final,
+    es decir, que contenga la posición del símbolo EOF.
+    
+    Parámetros:
+      - dfa_obj: objeto DFA o MinimizedDFA.
+      - input_string: cadena de entrada a evaluar.
+      - minimized: si es True, se usa la versión minimizada.
+      - prefilter: Prefilter opcional; si la cadena no lo cumple se rechaza
+        sin recorrer el autómata.
+    
+    Retorna True si la cadena es aceptada, False en caso contrario.
+    """
+    if prefilter is not None and not prefilter.admits(input_string):
+        return False
+    if minimized:
+        transitions = dfa_obj.minimized_transitions
+        current_state = dfa_obj.minimized_start
+        final_states = dfa_obj.minimized_final
+    else:
+        transitions = dfa_obj.transitions
+        current_state = dfa_obj.start_state
+        final_states = dfa_obj.final_states
+    
+    for ch in input_string:
+        if current_state in transitions and ch in transitions[current_state]:
+            current_state = transitions[current_state][ch]
+        else:
+            return False
+    return current_state in final_states
+
+def build_syntax_tree(expr):
+    """
+    Preprocesa, analiza y simplifica una expresión infija.
+    Retorna (ast, syntax_tree).
+    """
+    ast = simplify(parse_regex(preprocess_expression(expr)))
+    tokens = tokenize_postfix(to_postfix(ast))
+    return ast, SyntaxTree(tokens)
+
+def compile_expression(expr, limits=None, engine="positions"):
+    """
+    Compila una expresión infija hasta el DFA minimizado, sin generar imágenes.
+    `engine` elige la construcción del DFA: "positions" (followpos) o
+    "derivatives" (derivadas de Brzozowski).
+    Con `limits` (CompileLimits) puede lanzar StateExplosionError.
+    Retorna (min_dfa, prefilter).
+    """
+    ast, syntax_tree = build_syntax_tree(expr)
+    if engine == "positions":
+        dfa = DFA(syntax_tree, limits)
+    elif engine == "derivatives":
+        dfa = DerivativeDFA(ast, limits)
+    else:
+        raise ValueError("Unknown engine: " + engine)
+    min_dfa = MinimizedDFA(dfa, limits)
+    return min_dfa, Prefilter.from_ast(ast)
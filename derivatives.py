@@ -0,0 +1,209 @@
+import sys
+import time
+from DFA import DFA
+from parser import Literal, Concat, Alternation, Star, Plus, Epsilon, flatten_concat
+from simplifier import Simplifier
+
+def _children(node):
+    if isinstance(node, (Concat, Alternation)):
+        return (node.left, node.right)
+    if isinstance(node, (Star, Plus)):
+        return (node.child,)
+    return ()
+
+def _flat_children(node):
+    if isinstance(node, Concat):
+        return flatten_concat(node)
+    return _children(node)
+
+class DerivativeDFA:
+    def __init__(self, ast, limits=None):
+        """
+        Construye el DFA mediante derivadas de Brzozowski sobre el AST del
+        parser, como alternativa al método de followpos. Cada estado es una
+        expresión normalizada: las alternancias se aplanan, se eliminan las
+        ramas repetidas y se ordenan de forma canónica (Simplifier sin
+        factorización de prefijos, que daría formas distintas para el mismo
+        conjunto de ramas), y las concatenaciones son listas enlazadas
+        cabeza · resto. Los nodos se comparten (hash-consing), de modo que dos
+        derivadas iguales módulo asociatividad, conmutatividad e idempotencia
+        de la alternancia son el mismo objeto y el mismo estado. Así el
+        número de estados es finito y, para expresiones como
+        (a|b)*a(a|b)^k, ya es el mínimo; MinimizedDFA completa la
+        minimización en el caso general.
+
+        La derivada de una concatenación cabeza · resto reutiliza el nodo
+        resto (y su derivada memorizada), sin reconstruir el sufijo en cada
+        paso. Las derivadas se memorizan por (símbolo, nodo).
+
+        Expone solo la parte de la interfaz de DFA que usan MinimizedDFA y
+        simulate_dfa (start_state, transitions, final_states, eof_symbol) y
+        su visualize; no tiene followpos ni las funciones nullable/firstpos/
+        lastpos de DFA. Los estados son frozenset({i}), donde i indexa
+        self.expressions. El lenguaje vacío se representa con None.
+        """
+        self.limits = limits
+        self.eof_symbol = '☒'
+        self.simplifier = Simplifier(factor_prefixes=False)
+        self._nullable = {}
+        self._derivatives = {}
+        root = self._to_sequences(self.simplifier.simplify(ast))
+        self.alphabet = sorted({node.value for node in self._postorder(root)
+                                if isinstance(node, Literal)})
+        self.expressions = [root]
+        self.start_state = frozenset({0})
+        self.build_dfa()
+
+    def _postorder(self, node, memo=None, children=_children):
+        """
+        Recorre el DAG del AST en postorden con pila explícita, una vez por
+        nodo, omitiendo los nodos ya presentes en `memo`.
+        """
+        seen = set()
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if id(current) in seen or (memo is not None and id(current) in memo):
+                continue
+            if visited:
+                seen.add(id(current))
+                yield current
+            else:
+                stack.append((current, True))
+                for child in reversed(children(current)):
+                    stack.append((child, False))
+
+    def _cons(self, head, tail):
+        """
+        Concatenación cabeza · resto, donde `head` no es una concatenación.
+        """
+        if head is self.simplifier.epsilon:
+            return tail
+        if tail is self.simplifier.epsilon:
+            return head
+        return self.simplifier._intern(('·', id(head), id(tail)), lambda: Concat(head, tail))
+
+    def _sequence(self, head, tail):
+        """
+        Antepone la lista `head` (un nodo o una lista cabeza · resto) a `tail`.
+        """
+        items = []
+        while isinstance(head, Concat):
+            items.append(head.left)
+            head = head.right
+        node = self._cons(head, tail)
+        for item in reversed(items):
+            node = self._cons(item, node)
+        return node
+
+    def _to_sequences(self, root):
+        """
+        Reescribe las concatenaciones del AST simplificado (cadenas asociadas
+        a la izquierda) como listas cabeza · resto.
+        """
+        simplifier = self.simplifier
+        memo = {}
+        for current in self._postorder(root, memo, _flat_children):
+            if isinstance(current, Concat):
+                items = [memo[id(item)] for item in flatten_concat(current)]
+                value = simplifier.epsilon
+                for item in reversed(items):
+                    value = self._sequence(item, value)
+            elif isinstance(current, Alternation):
+                value = simplifier.alternation(memo[id(current.left)], memo[id(current.right)])
+            elif isinstance(current, Star):
+                value = simplifier.star(memo[id(current.child)])
+            elif isinstance(current, Plus):
+                value = simplifier.plus(memo[id(current.child)])
+            else:
+                value = current
+            memo[id(current)] = value
+        return memo[id(root)]
+
+    def _is_nullable(self, node):
+        memo = self._nullable
+        for current in self._postorder(node, memo):
+            if isinstance(current, Literal):
+                value = False
+            elif isinstance(current, (Epsilon, Star)):
+                value = True
+            elif isinstance(current, Concat):
+                value = memo[id(current.left)] and memo[id(current.right)]
+            elif isinstance(current, Alternation):
+                value = memo[id(current.left)] or memo[id(current.right)]
+            else:
+                value = memo[id(current.child)]
+            memo[id(current)] = value
+        return memo[id(node)]
+
+    def derivative(self, node, symbol):
+        """
+        Derivada de `node` respecto a `symbol`, o None si es el lenguaje vacío.
+        """
+        simplifier = self.simplifier
+        memo = self._derivatives.setdefault(symbol, {})
+        for current in self._postorder(node, memo):
+            if isinstance(current, Literal):
+                value = simplifier.epsilon if current.value == symbol else None
+            elif isinstance(current, Epsilon):
+                value = None
+            elif isinstance(current, Alternation):
+                left, right = memo[id(current.left)], memo[id(current.right)]
+                if left is None:
+                    value = right
+                elif right is None:
+                    value = left
+                else:
+                    value = simplifier.alternation(left, right)
+            elif isinstance(current, Concat):
+                # d(x · r) = d(x) · r | d(r) si x es anulable.
+                head = memo[id(current.left)]
+                value = None if head is None else self._sequence(head, current.right)
+                if self._is_nullable(current.left):
+                    rest = memo[id(current.right)]
+                    if value is None:
+                        value = rest
+                    elif rest is not None:
+                        value = simplifier.alternation(value, rest)
+            else:
+                child = memo[id(current.child)]
+                star = current if isinstance(current, Star) else simplifier.star(current.child)
+                value = None if child is None else self._sequence(child, star)
+            memo[id(current)] = value
+        return memo[id(node)]
+
+    def build_dfa(self):
+        """
+        Explora en anchura las derivadas de la expresión inicial respecto a
+        cada símbolo del alfabeto. Las derivadas vacías no generan transición.
+        """
+        limits = self.limits
+        started = time.perf_counter()
+        transition_count = 0
+        memory = 0
+        self.transitions = {}
+        self.final_states = set()
+        numbers = {id(self.expressions[0]): 0}
+        index = 0
+        while index < len(self.expressions):
+            expression = self.expressions[index]
+            state = frozenset({index})
+            index += 1
+            self.transitions[state] = {}
+            for symbol in self.alphabet:
+                target = self.derivative(expression, symbol)
+                if target is None:
+                    continue
+                number = numbers.get(id(target))
+                if number is None:
+                    number = len(self.expressions)
+                    numbers[id(target)] = number
+                    self.expressions.append(target)
+                self.transitions[state][symbol] = frozenset({number})
+            if self._is_nullable(expression):
+                self.final_states.add(state)
+            if limits is not None:
+                transition_count += len(self.transitions[state])
+                memory += sys.getsizeof(state) + sys.getsizeof(self.transitions[state])
+                limits.check("derivative construction", started, len(self.expressions),
+                             transition_count, memory)
@@ -0,0 +1,119 @@
+import re
+from collections import Counter
+from DFA import DFA
+
+CHUNK_BITS = 8  # un byte de to_bytes por bloque
+MAX_SHIFTS = 4  # distancias de arista que se resuelven con desplazamientos
+_nonzero_bytes = re.compile(b"[^\\x00]").finditer
+
+def _mask(positions):
+    mask = 0
+    for pos in positions:
+        mask |= 1 << pos
+    return mask
+
+class GlushkovMatcher:
+    def __init__(self, syntax_tree):
+        """
+        Simula el autómata de Glushkov (posiciones) que describen followpos y
+        pos_to_symbol con máscaras de bits sobre enteros de Python, sin
+        construcción por subconjuntos: el bit i del estado indica que la
+        posición i puede leerse a continuación.
+
+        Para un símbolo c, las posiciones activas que lo leen son
+        estado & symbol_masks[c]; el nuevo estado es la unión de followpos de
+        esas posiciones. Como las posiciones se numeran de izquierda a
+        derecha, casi todas las aristas de followpos unen posiciones a una
+        distancia fija (i → i + 1 en una concatenación, el regreso al inicio
+        de un ciclo, los saltos de una alternativa): las MAX_SHIFTS
+        distancias más frecuentes se resuelven a la vez, para todas las
+        posiciones, con un desplazamiento del entero (<< d o >> -d).
+        Las aristas restantes forman una tabla de excepciones por bloques de
+        CHUNK_BITS bits: el estado activo se convierte una vez en bytes, los
+        bytes no nulos se localizan en C y cada uno indexa la tabla de su
+        bloque (que se llena bajo demanda) con la unión de sus aristas.
+        Es la versión con máscaras de bits de nfa.PositionNFA, que simula el
+        mismo autómata con conjuntos de posiciones.
+        """
+        followpos = {}
+        pos_to_symbol = {}
+        _, firstpos, _ = DFA.compute_functions(syntax_tree.root, followpos, pos_to_symbol, [1])
+        self.eof_symbol = '☒'
+        self.start_mask = _mask(firstpos)
+        self.eof_mask = 0
+        distances = Counter(target - pos for pos, targets in followpos.items()
+                            for target in targets)
+        shifts = [d for d, _ in distances.most_common(MAX_SHIFTS)]
+        shift_masks = dict.fromkeys(shifts, 0)
+        self.exceptions = {}
+        for pos, targets in followpos.items():
+            rest = 0
+            for target in targets:
+                if target - pos in shift_masks:
+                    shift_masks[target - pos] |= 1 << pos
+                else:
+                    rest |= 1 << target
+            if rest:
+                self.exceptions[pos] = rest
+        exception_mask = _mask(self.exceptions)
+        symbol_masks = {}
+        for pos, symbol in pos_to_symbol.items():
+            if symbol == self.eof_symbol:
+                self.eof_mask |= 1 << pos
+            else:
+                symbol_masks[symbol] = symbol_masks.get(symbol, 0) | (1 << pos)
+        self.symbols = {}
+        for symbol, mask in symbol_masks.items():
+            moves = tuple((d, mask & m) for d, m in shift_masks.items() if mask & m)
+            self.symbols[symbol] = (mask, moves, mask & exception_mask)
+        size = max(pos_to_symbol, default=0) // CHUNK_BITS + 1
+        self._size = size
+        self._chunk_tables = [{} for _ in range(size)]
+
+    def _chunk_follow(self, chunk, value):
+        """
+        Unión de las aristas de excepción de las posiciones marcadas en
+        `value` dentro del bloque `chunk`.
+        """
+        result = 0
+        base = chunk * CHUNK_BITS
+        bits = value
+        while bits:
+            low = bits & -bits
+            result |= self.exceptions.get(base + low.bit_length() - 1, 0)
+            bits ^= low
+        self._chunk_tables[chunk][value] = result
+        return result
+
+    def match(self, input_string):
+        """
+        Retorna True si la cadena es aceptada.
+        """
+        symbols = self.symbols
+        tables = self._chunk_tables
+        size = self._size
+        state = self.start_mask
+        for ch in input_string:
+            entry = symbols.get(ch)
+            if entry is None:
+                return False
+            mask, moves, exception_mask = entry
+            active = state & mask
+            if not active:
+                return False
+            state = 0
+            for distance, move_mask in moves:
+                bits = active & move_mask
+                if bits:
+                    state |= bits << distance if distance > 0 else bits >> -distance
+            exceptional = active & exception_mask
+            if exceptional:
+                data = exceptional.to_bytes(size, "little")
+                for found in _nonzero_bytes(data):
+                    chunk = found.start()
+                    value = data[chunk]
+                    follow = tables[chunk].get(value)
+                    if follow is None:
+                        follow = self._chunk_follow(chunk, value)
+                    state |= follow
+        return bool(state & self.eof_mask)
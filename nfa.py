@@ -0,0 +1,42 @@
+from DFA import DFA
+
+class PositionNFA:
+    def __init__(self, syntax_tree):
+        """
+        Autómata de posiciones sin determinizar: reutiliza followpos y
+        pos_to_symbol (DFA.compute_functions) y simula directamente el
+        conjunto de posiciones activas, sin construcción por subconjuntos.
+        Es la implementación de referencia, basada en conjuntos, del
+        autómata que simula glushkov.GlushkovMatcher.
+        """
+        self.followpos = {}
+        self.pos_to_symbol = {}
+        _, firstpos, _ = DFA.compute_functions(syntax_tree.root, self.followpos,
+                                               self.pos_to_symbol, [1])
+        self.start_state = frozenset(firstpos)
+        self.eof_symbol = '☒'
+        self.eof_position = None
+        self.symbol_positions = {}
+        for pos, symbol in self.pos_to_symbol.items():
+            if symbol == self.eof_symbol:
+                self.eof_position = pos
+            else:
+                self.symbol_positions.setdefault(symbol, set()).add(pos)
+
+    def match(self, input_string):
+        """
+        Retorna True si la cadena es aceptada.
+        """
+        followpos = self.followpos
+        state = self.start_state
+        for ch in input_string:
+            positions = self.symbol_positions.get(ch)
+            if positions is None:
+                return False
+            next_state = set()
+            for pos in positions.intersection(state):
+                next_state.update(followpos.get(pos, ()))
+            if not next_state:
+                return False
+            state = next_state
+        return self.eof_position in state
@@ -1,9 +1,10 @@
 from symbol import Symbol
 
 class Node:
-    pass
+    __slots__ = ()
 
 class Literal(Node):
+    __slots__ = ('value', 'escaped')
     def __init__(self, value, escaped=False):
         self.value = value
         self.escaped = escaped  
@@ -11,6 +12,7 @@ class Literal(Node):
         return self.value
 
 class Concat(Node):
+    __slots__ = ('left', 'right')
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -18,6 +20,7 @@ class Concat(Node):
         return f"Concat({self.left},{self.right})"
 
 class Alternation(Node):
+    __slots__ = ('left', 'right')
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -25,29 +28,46 @@ class Alternation(Node):
         return f"Alt({self.left},{self.right})"
 
 class Star(Node):
+    __slots__ = ('child',)
     def __init__(self, child):
         self.child = child
     def __repr__(self):
         return f"Star({self.child})"
 
 class Epsilon(Node):
+    __slots__ = ('value',)
     def __init__(self):
         self.value = "ε"
     def __repr__(self):
         return self.value
 
 class Plus(Node):
+    __slots__ = ('child',)
     def __init__(self, child):
         self.child = child
     def __repr__(self):
         return f"Plus({self.child})"
 
 class Group(Node):
+    __slots__ = ('child',)
     def __init__(self, child):
         self.child = child
     def __repr__(self):
         return f"Group({self.child})"
 
+class _Frame:
+    """
+    Nivel de agrupación abierto durante el análisis:
+      - closer: carácter que cierra el grupo (None en el nivel superior).
+      - alternation: alternancia acumulada de los términos ya cerrados.
+      - term: concatenación acumulada del término actual.
+    """
+    __slots__ = ('closer', 'alternation', 'term')
+    def __init__(self, closer):
+        self.closer = closer
+        self.alternation = None
+        self.term = None
+
 class Parser:
     def __init__(self, input_str):
         self.input = input_str
@@ -65,31 +85,53 @@ class Parser:
         return ch
     
     def parse_expression(self):
-        node = self.parse_term()
-        while self.current() == '|':
-            self.consume()  
-            right = self.parse_term()
-            node = Alternation(node, right)
-        return node
-    
-    def parse_term(self):
-        node = self.parse_factor()
-        while self.current() is not None and self.current() not in {')', '}', '|'}:
-            if self.current() == '·':
-                self.consume()  
+        """
+        Analiza la expresión con una pila explícita de niveles de agrupación
+        en lugar de recursión, de modo que el anidamiento profundo no agota
+        la pila de Python. La precedencia es la habitual: los operadores
+        postfijos ligan más que la concatenación y esta más que '|'.
+        """
+        stack = [_Frame(None)]
+        expect_factor = True
+        while True:
+            frame = stack[-1]
+            ch = self.current()
+            if expect_factor:
+                if ch in ('(', '{'):
+                    self.consume()
+                    stack.append(_Frame(')' if ch == '(' else '}'))
+                    continue
+                node = self.parse_base()
+            elif ch is None or ch in (')', '}'):
+                node = Parser._close_term(frame)
+                if frame.closer is None:
+                    return node
+                if ch != frame.closer:
+                    raise ValueError(f"Expected '{frame.closer}' at position {self.pos}")
+                self.consume()
+                stack.pop()
+                frame = stack[-1]
+                node = Group(node)
+            elif ch == '|':
+                self.consume()
+                frame.alternation = Parser._close_term(frame)
+                frame.term = None
+                expect_factor = True
+                continue
+            elif ch == '·':
+                self.consume()
                 if self.current() is None or not Parser.is_valid_factor_start(self.current()):
                     raise ValueError("Expected factor after concatenation operator")
-                right = self.parse_factor()
-                node = Concat(node, right)
-            elif Parser.is_valid_factor_start(self.current()):
-                right = self.parse_factor()
-                node = Concat(node, right)
+                expect_factor = True
+                continue
             else:
-                break
-        return node
-    
-    def parse_factor(self):
-        node = self.parse_base()
+                expect_factor = True
+                continue
+            node = self.parse_postfix(node)
+            frame.term = node if frame.term is None else Concat(frame.term, node)
+            expect_factor = False
+
+    def parse_postfix(self, node):
         while self.current() in ['*', '+', '?']:
             op = self.consume()
             if op == '*':
@@ -101,6 +143,9 @@ class Parser:
         return node
     
     def parse_base(self):
+        """
+        Analiza un operando que no abre un grupo: un literal o un literal escapado.
+        """
         ch = self.current()
         if ch is None:
             raise ValueError("Unexpected end of input in parse_base")
@@ -108,23 +153,15 @@ class Parser:
             self.consume()  
             next_ch = self.consume()
             return Literal(next_ch, escaped=True)
-        if ch == '(':
-            self.consume()  
-            node = self.parse_expression()
-            if self.current() != ')':
-                raise ValueError("Expected ')' at position " + str(self.pos))
-            self.consume()  
-            return Group(node)
-        if ch == '{':
-            self.consume()  
-            node = self.parse_expression()
-            if self.current() != '}':
-                raise ValueError("Expected '}' at position " + str(self.pos))
-            self.consume()  
-            return Group(node)
         if ch in {'·', '|', '*', '+', '?'}:
             raise ValueError(f"Unexpected operator '{ch}' at position {self.pos}")
         return Literal(self.consume())
+
+    @staticmethod
+    def _close_term(frame):
+        if frame.alternation is None:
+            return frame.term
+        return Alternation(frame.alternation, frame.term)
     
     @staticmethod
     def is_valid_factor_start(ch):
@@ -162,29 +199,35 @@ def to_postfix(node):
     """
     Convierte el AST a notación postfix.
     Para un nodo de concatenación con N operandos se generan N-1 operadores '·'.
+    El recorrido usa una pila explícita de trabajo: cada entrada es un nodo
+    pendiente de convertir o un token ya listo para emitirse.
     """
-    if isinstance(node, Literal):
-        if hasattr(node, 'escaped') and node.escaped:
-            return f"lit({node.value})"
-        return node.value
-    elif isinstance(node, Epsilon):
-        return "ε"
-    elif isinstance(node, Star):
-        return to_postfix(node.child) + " *"
-    elif isinstance(node, Plus):
-        base = to_postfix(node.child)
-        star = to_postfix(Star(node.child))
-        return base + " " + star + " ·"
-    elif isinstance(node, Alternation):
-        return to_postfix(node.left) + " " + to_postfix(node.right) + " |"
-    elif isinstance(node, Concat):
-        operands = flatten_concat(node)
-        parts = [to_postfix(op) for op in operands]
-        if len(operands) > 1:
-            return " ".join(parts) + " " + " ".join("·" for _ in range(len(operands) - 1))
+    output = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            output.append(current)
+        elif isinstance(current, Literal):
+            if current.escaped:
+                output.append(f"lit({current.value})")
+            else:
+                output.append(current.value)
+        elif isinstance(current, Epsilon):
+            output.append("ε")
+        elif isinstance(current, Star):
+            stack.append("*")
+            stack.append(current.child)
+        elif isinstance(current, Plus):
+            stack.extend(("·", "*", current.child, current.child))
+        elif isinstance(current, Alternation):
+            stack.extend(("|", current.right, current.left))
+        elif isinstance(current, Concat):
+            operands = flatten_concat(current)
+            stack.extend("·" for _ in range(len(operands) - 1))
+            stack.extend(reversed(operands))
+        elif isinstance(current, Group):
+            stack.append(current.child)
         else:
-            return parts[0]
-    elif isinstance(node, Group):
-        return to_postfix(node.child)
-    else:
-        raise ValueError("Unknown node type in conversion")
+            raise ValueError("Unknown node type in conversion")
+    return " ".join(output)
@@ -0,0 +1,147 @@
+from parser import Literal, Concat, Alternation, Star, Plus, Group, Epsilon
+
+MAX_FACTOR = 64  # longitud máxima de prefijos, sufijos y factores
+
+def _common_prefix(a, b):
+    size = 0
+    limit = min(len(a), len(b))
+    while size < limit and a[size] == b[size]:
+        size += 1
+    return a[:size]
+
+def _common_suffix(a, b):
+    size = 0
+    limit = min(len(a), len(b))
+    while size < limit and a[-1 - size] == b[-1 - size]:
+        size += 1
+    return a[len(a) - size:]
+
+def _union(a, b):
+    # Une en el conjunto más grande para no copiarlo en cada paso.
+    if len(a) < len(b):
+        a, b = b, a
+    a |= b
+    return a
+
+def _closed(single, prefix, suffix, factors):
+    # Una racha de literales aporta su prefijo y su sufijo al cerrarse.
+    if single:
+        factors = factors | {prefix, suffix}
+    return factors
+
+class Prefilter:
+    def __init__(self, factors, min_length, max_length):
+        """
+        Condiciones necesarias para que una cadena sea aceptada:
+          - factors: literales que deben aparecer como subcadenas.
+          - min_length / max_length: longitud mínima y máxima en caracteres
+            (max_length es None si la expresión no está acotada).
+        Si una entrada no cumple alguna condición no hace falta simular el DFA.
+        """
+        self.factors = tuple(factors)
+        self.byte_factors = tuple(f.encode("utf-8") for f in self.factors)
+        self.min_length = min_length
+        self.max_length = max_length
+
+    @classmethod
+    def from_ast(cls, ast):
+        """
+        Deriva el prefiltro del AST del parser. Para cada nodo se calcula, en
+        postorden con pila explícita:
+          - single: si reconoce una única cadena;
+          - prefix / suffix: literal con el que comienza / termina toda
+            coincidencia, de a lo sumo MAX_FACTOR caracteres;
+          - factors: literales obligatorios dentro de la subexpresión; las
+            rachas de literales (nodos single) no se agregan paso a paso sino
+            al cerrarse, con su prefijo y sufijo;
+          - min / max: cotas de longitud.
+        """
+        results = []
+        stack = [(ast, False)]
+        while stack:
+            node, visited = stack.pop()
+            if isinstance(node, Epsilon) or (isinstance(node, Literal) and node.value == "ε"):
+                results.append((True, "", "", set(), 0, 0))
+            elif isinstance(node, Literal):
+                value = node.value
+                results.append((True, value, value, set(), 1, 1))
+            elif not visited:
+                stack.append((node, True))
+                if isinstance(node, (Concat, Alternation)):
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                elif isinstance(node, (Star, Plus, Group)):
+                    stack.append((node.child, False))
+                else:
+                    raise ValueError("Unknown node type in prefilter")
+            elif isinstance(node, Concat):
+                r_single, r_prefix, r_suffix, r_factors, r_min, r_max = results.pop()
+                l_single, l_prefix, l_suffix, l_factors, l_min, l_max = results.pop()
+                single = l_single and r_single
+                prefix = (l_prefix + r_prefix)[:MAX_FACTOR] if l_single else l_prefix
+                suffix = (l_suffix + r_suffix)[-MAX_FACTOR:] if r_single else r_suffix
+                factors = _union(l_factors, r_factors)
+                if not single:
+                    factors.add(l_suffix + r_prefix)
+                    if l_single:
+                        factors.add(l_prefix)
+                    if r_single:
+                        factors.add(r_suffix)
+                maximum = l_max + r_max if l_max is not None and r_max is not None else None
+                results.append((single, prefix, suffix, factors, l_min + r_min, maximum))
+            elif isinstance(node, Alternation):
+                r_single, r_prefix, r_suffix, r_factors, r_min, r_max = results.pop()
+                l_single, l_prefix, l_suffix, l_factors, l_min, l_max = results.pop()
+                # Dos cadenas únicas son iguales si se conocen completas y coinciden.
+                single = (l_single and r_single and l_min == r_min
+                          and l_min <= MAX_FACTOR and l_prefix == r_prefix)
+                prefix = _common_prefix(l_prefix, r_prefix)
+                suffix = _common_suffix(l_suffix, r_suffix)
+                factors = _closed(l_single, l_prefix, l_suffix, l_factors) & \
+                    _closed(r_single, r_prefix, r_suffix, r_factors)
+                factors.update((prefix, suffix))
+                maximum = max(l_max, r_max) if l_max is not None and r_max is not None else None
+                results.append((single, prefix, suffix, factors, min(l_min, r_min), maximum))
+            elif isinstance(node, Star):
+                _, _, _, _, _, maximum = results.pop()
+                if maximum == 0:
+                    results.append((True, "", "", set(), 0, 0))
+                else:
+                    results.append((False, "", "", set(), 0, None))
+            elif isinstance(node, Plus):
+                single, prefix, suffix, factors, minimum, maximum = results.pop()
+                if maximum == 0:
+                    results.append((True, "", "", set(), 0, 0))
+                else:
+                    factors = _closed(single, prefix, suffix, factors)
+                    results.append((False, prefix, suffix, factors, minimum, None))
+        single, prefix, suffix, factors, minimum, maximum = results.pop()
+        factors = _closed(single, prefix, suffix, factors)
+        factors = sorted((f for f in factors if f), key=len, reverse=True)
+        kept = []
+        for factor in factors:
+            if not any(factor in other for other in kept):
+                kept.append(factor)
+        return cls(kept, minimum, maximum)
+
+    def admits(self, data):
+        """
+        Retorna False si `data` (str o bytes) no puede ser aceptada por la
+        expresión; True si hay que simular el autómata para decidirlo.
+        Sobre bytes la cota máxima se relaja a 4 bytes por carácter (UTF-8).
+        """
+        size = len(data)
+        if size < self.min_length:
+            return False
+        if isinstance(data, str):
+            factors = self.factors
+            maximum = self.max_length
+        else:
+            factors = self.byte_factors
+            maximum = None if self.max_length is None else 4 * self.max_length
+        if maximum is not None and size > maximum:
+            return False
+        for factor in factors:
+            if data.find(factor) < 0:
+                return False
+        return True
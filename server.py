@@ -0,0 +1,349 @@
+import argparse
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from core import build_syntax_tree
+from DFA import DFA, CompileLimits, StateExplosionError
+from MinimizedDFA import MinimizedDFA
+from glushkov import GlushkovMatcher
+from prefilter import Prefilter
+from codegen import compile_matcher
+
+DEFAULT_LIMITS = CompileLimits(max_states=10000, max_transitions=200000,
+                               max_memory=64 * 1024 * 1024, max_time=2.0)
+
+CACHE_SIZE = 256
+
+_compiled = OrderedDict()
+_compiled_lock = threading.Lock()
+
+def _cache_key(expr, limits):
+    if limits is None:
+        return (expr, None)
+    return (expr, (limits.max_states, limits.max_transitions,
+                   limits.max_memory, limits.max_time))
+
+def cached_matcher(expr, limits=DEFAULT_LIMITS):
+    """
+    Retorna el matcher ya compilado para (expr, limits), o None si no está
+    en la caché.
+    """
+    key = _cache_key(expr, limits)
+    with _compiled_lock:
+        matcher = _compiled.get(key)
+        if matcher is not None:
+            _compiled.move_to_end(key)
+        return matcher
+
+def get_matcher(expr, limits=DEFAULT_LIMITS):
+    """
+    Retorna una función `match(text)` para la expresión: prefiltro seguido
+    del matcher generado para el DFA minimizado. Si el DFA supera el
+    presupuesto `limits`, o no es posible compilar su código generado, la
+    expresión se evalúa con el autómata de Glushkov con máscaras de bits en
+    lugar de fallar.
+    Los matchers se guardan en una caché LRU de CACHE_SIZE entradas por
+    proceso, indexada por la expresión y los valores de `limits`. Puede
+    llamarse desde varios hilos.
+    """
+    matcher = cached_matcher(expr, limits)
+    if matcher is not None:
+        return matcher
+    ast, syntax_tree = build_syntax_tree(expr)
+    admits = Prefilter.from_ast(ast).admits
+    try:
+        min_dfa = MinimizedDFA(DFA(syntax_tree, limits), limits)
+        generated = compile_matcher(min_dfa)
+    except (StateExplosionError, RecursionError, MemoryError, SyntaxError):
+        # Presupuesto agotado o código generado que Python no puede compilar.
+        generated = GlushkovMatcher(syntax_tree).match
+
+    def matcher(text):
+        return admits(text) and generated(text)
+
+    key = _cache_key(expr, limits)
+    with _compiled_lock:
+        _compiled[key] = matcher
+        while len(_compiled) > CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return matcher
+
+def _match_each(matcher, inputs):
+    results = []
+    for text in inputs:
+        try:
+            results.append(matcher(text))
+        except Exception as e:
+            results.append(e)
+    return results
+
+def match_batch(expr, inputs):
+    """
+    Evalúa un lote de cadenas contra una misma expresión. Es una función de
+    módulo para poder ejecutarse en los procesos del pool; cada proceso
+    conserva su propia caché de expresiones compiladas.
+    Retorna un resultado por cadena: True/False, o la excepción que produjo
+    esa cadena (o la compilación de la expresión), sin que un elemento
+    inválido afecte al resto del lote.
+    """
+    try:
+        matcher = get_matcher(expr)
+    except Exception as e:
+        return [e] * len(inputs)
+    return _match_each(matcher, inputs)
+
+class MatchService:
+    def __init__(self, workers=0, batch_size=256, batch_delay=0.001,
+                 max_pending=10000, offload_threshold=64):
+        """
+        Servicio de coincidencias que agrupa las solicitudes concurrentes:
+          - workers: procesos del pool para lotes grandes (0 = todo en el hilo del loop).
+          - batch_size / batch_delay: tamaño máximo de un lote y tiempo que se
+            espera a que lleguen más solicitudes antes de despacharlo.
+          - max_pending: capacidad de la cola; cuando se llena, `match` espera
+            (contrapresión hacia las conexiones).
+          - offload_threshold: tamaño a partir del cual el grupo de una
+            expresión se envía al pool en lugar de evaluarse en línea.
+        Las expresiones que no están en la caché se compilan en un hilo del
+        executor por defecto, para no bloquear el loop; las solicitudes que
+        llegan mientras tanto esperan a la misma compilación.
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.offload_threshold = offload_threshold
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.executor = ProcessPoolExecutor(workers) if workers else None
+        self.inflight = asyncio.Semaphore(max(1, 2 * workers))
+        self.stats = {"requests": 0, "batches": 0, "offloaded": 0}
+        self._batcher = None
+        self._tasks = set()
+        self._compiling = {}
+        self._closed = False
+
+    def start(self):
+        self._batcher = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        """
+        Detiene el despachador y falla con RuntimeError las solicitudes que
+        quedaban en la cola, para que ningún llamador de `match` espere
+        indefinidamente.
+        """
+        self._closed = True
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        while not self.queue.empty():
+            _, text, future = self.queue.get_nowait()
+            self._fail([(text, future)], RuntimeError("service closed"))
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def match(self, expr, text):
+        """
+        Encola una solicitud y espera su resultado (True/False).
+        Los errores de compilación de la expresión se propagan como excepción.
+        """
+        if not isinstance(expr, str) or not isinstance(text, str):
+            raise TypeError("pattern and input must be strings")
+        if self._closed:
+            raise RuntimeError("service closed")
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((expr, text, future))
+        self.stats["requests"] += 1
+        if self._closed:
+            self._fail([(text, future)], RuntimeError("service closed"))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_delay
+            try:
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Las solicitudes ya extraídas de la cola no se despacharán.
+                self._fail([(text, future) for _, text, future in batch],
+                           RuntimeError("service closed"))
+                raise
+            self.stats["batches"] += 1
+            try:
+                await self._dispatch(loop, batch)
+            except Exception as e:
+                # Ningún error de un lote debe detener el despachador.
+                self._fail([(text, future) for _, text, future in batch], e)
+
+    async def _dispatch(self, loop, batch):
+        groups = {}
+        for expr, text, future in batch:
+            try:
+                groups.setdefault(expr, []).append((text, future))
+            except TypeError as e:
+                self._fail([(text, future)], e)
+        for expr, items in groups.items():
+            if self.executor is not None and len(items) >= self.offload_threshold:
+                await self.inflight.acquire()
+                self._spawn(loop, self._offload(expr, items))
+                continue
+            matcher = cached_matcher(expr)
+            if matcher is None:
+                self._spawn(loop, self._compile_and_match(loop, expr, items))
+            else:
+                self._deliver(items, _match_each(matcher, [t for t, _ in items]))
+
+    def _spawn(self, loop, coroutine):
+        task = loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _compile_and_match(self, loop, expr, items):
+        compiling = self._compiling.get(expr)
+        if compiling is None:
+            compiling = loop.run_in_executor(None, get_matcher, expr)
+            self._compiling[expr] = compiling
+            compiling.add_done_callback(lambda _: self._compiling.pop(expr, None))
+        try:
+            matcher = await asyncio.shield(compiling)
+        except Exception as e:
+            self._fail(items, e)
+        else:
+            self._deliver(items, _match_each(matcher, [t for t, _ in items]))
+
+    async def _offload(self, expr, items):
+        loop = asyncio.get_running_loop()
+        self.stats["offloaded"] += 1
+        try:
+            inputs = [t for t, _ in items]
+            try:
+                results = await loop.run_in_executor(self.executor, match_batch, expr, inputs)
+            except Exception as e:
+                self._fail(items, e)
+            else:
+                self._deliver(items, results)
+        finally:
+            self.inflight.release()
+
+    @staticmethod
+    def _deliver(items, results):
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(items, error):
+        for _, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+async def handle_connection(service, reader, writer, max_inflight=1000):
+    """
+    Atiende una conexión con protocolo JSON delimitado por líneas:
+      solicitud: {"id": ..., "pattern": "...", "input": "..."}
+      respuesta: {"id": ..., "match": true|false} o {"id": ..., "error": "..."}
+    Las solicitudes cuyo "pattern" o "input" no es una cadena reciben un error.
+    Las respuestas pueden llegar en distinto orden que las solicitudes. Cuando
+    hay `max_inflight` solicitudes pendientes se deja de leer del socket.
+    """
+    slots = asyncio.Semaphore(max_inflight)
+    write_lock = asyncio.Lock()
+    tasks = set()
+
+    async def respond(payload):
+        async with write_lock:
+            writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+            await writer.drain()
+
+    async def process(request):
+        try:
+            request_id = request.get("id")
+            try:
+                result = await service.match(request.get("pattern"), request.get("input"))
+            except Exception as e:
+                await respond({"id": request_id, "error": str(e)})
+            else:
+                await respond({"id": request_id, "match": result})
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+            except ValueError as e:
+                await respond({"id": None, "error": str(e)})
+                continue
+            await slots.acquire()
+            task = asyncio.get_running_loop().create_task(process(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        writer.close()
+
+async def start_server(service, host="127.0.0.1", port=8765, unix_path=None):
+    """
+    Inicia el servicio y abre el socket TCP (o Unix si se indica `unix_path`).
+    """
+    service.start()
+
+    def handler(reader, writer):
+        return handle_connection(service, reader, writer)
+
+    if unix_path is not None:
+        return await asyncio.start_unix_server(handler, path=unix_path)
+    return await asyncio.start_server(handler, host, port)
+
+async def serve(args):
+    service = MatchService(workers=args.workers, batch_size=args.batch_size,
+                           batch_delay=args.batch_delay / 1000, max_pending=args.max_pending)
+    server = await start_server(service, args.host, args.port, args.unix)
+    for sock in server.sockets:
+        print("Serving on", sock.getsockname())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servicio de coincidencias sobre DFAs minimizados.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Ruta de un socket Unix en lugar de TCP")
+    parser.add_argument("--workers", type=int, default=0, help="Procesos para lotes grandes")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--batch-delay", type=float, default=1.0, help="Milisegundos de espera por lote")
+    parser.add_argument("--max-pending", type=int, default=10000)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
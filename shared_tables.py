@@ -0,0 +1,102 @@
+from array import array
+from multiprocessing import shared_memory
+from codegen import number_states
+
+MAGIC = 0x44464131  # "DFA1"
+HEADER_FIELDS = 4   # magic, número de estados, número de símbolos, estado inicial
+DEAD = -1
+
+def dense_table(min_dfa):
+    """
+    Convierte las transiciones de un MinimizedDFA en una tabla densa de enteros.
+    Retorna (alphabet, table, finals):
+      - alphabet: símbolos ordenados; la columna de un símbolo es su índice.
+      - table: lista plana de n_estados * len(alphabet) enteros (DEAD si no hay transición).
+      - finals: lista con 1 para los estados finales y 0 para el resto.
+    Los estados se numeran con codegen.number_states (el inicial es el 0).
+    """
+    numbers, order = number_states(min_dfa)
+    transitions = min_dfa.minimized_transitions
+    alphabet = sorted({sym for trans in transitions.values() for sym in trans})
+    columns = {sym: i for i, sym in enumerate(alphabet)}
+    width = len(alphabet)
+    table = [DEAD] * (len(order) * width)
+    for state in order:
+        row = numbers[state] * width
+        for sym, target in transitions.get(state, {}).items():
+            table[row + columns[sym]] = numbers[target]
+    finals = [1 if state in min_dfa.minimized_final else 0 for state in order]
+    return alphabet, table, finals
+
+def export_shared(min_dfa, name=None):
+    """
+    Copia el DFA minimizado a un bloque de memoria compartida con el formato:
+      int32[HEADER_FIELDS]  magic, n_estados, n_símbolos, estado inicial
+      int32[n_símbolos]     puntos de código del alfabeto
+      int32[n_estados * n_símbolos]  tabla de transiciones
+      uint8[n_estados]      marca de estado final
+    Retorna el SharedMemory creado; el proceso que lo crea es responsable de
+    llamar a close() y unlink() cuando ya no se necesite.
+    """
+    alphabet, table, finals = dense_table(min_dfa)
+    ints = [MAGIC, len(finals), len(alphabet), 0] + [ord(sym) for sym in alphabet] + table
+    size = 4 * len(ints) + len(finals)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    shm.buf[:4 * len(ints)] = array("i", ints).tobytes()
+    shm.buf[4 * len(ints):size] = bytes(finals)
+    return shm
+
+class SharedDFA:
+    def __init__(self, name):
+        """
+        Vista de solo lectura de un DFA exportado con export_shared. Se adjunta
+        al bloque por nombre y lee la tabla directamente de la memoria
+        compartida, sin copiarla ni deserializarla; solo el alfabeto (pequeño)
+        se carga en un diccionario de símbolo a columna.
+        """
+        self.shm = shared_memory.SharedMemory(name=name)
+        ints = self.shm.buf.cast("B").toreadonly()
+        header = ints[:4 * HEADER_FIELDS].cast("i")
+        magic, num_states, width, start = header.tolist()
+        header.release()
+        if magic != MAGIC:
+            ints.release()
+            self.shm.close()
+            raise ValueError("Shared memory block does not contain a DFA table")
+        table_start = 4 * (HEADER_FIELDS + width)
+        table_end = table_start + 4 * num_states * width
+        alphabet = ints[4 * HEADER_FIELDS:table_start].cast("i")
+        self.columns = {chr(code): i for i, code in enumerate(alphabet)}
+        alphabet.release()
+        self.width = width
+        self.start = start
+        self.num_states = num_states
+        self.table = ints[table_start:table_end].cast("i")
+        self.finals = ints[table_end:table_end + num_states]
+        self._buffer = ints
+
+    def match(self, input_string):
+        """
+        Retorna True si la cadena es aceptada.
+        """
+        columns = self.columns
+        table = self.table
+        width = self.width
+        state = self.start
+        for ch in input_string:
+            column = columns.get(ch)
+            if column is None:
+                return False
+            state = table[state * width + column]
+            if state < 0:
+                return False
+        return self.finals[state] == 1
+
+    def close(self):
+        """
+        Libera las vistas y se separa del bloque (sin eliminarlo).
+        """
+        self.table.release()
+        self.finals.release()
+        self._buffer.release()
+        self.shm.close()
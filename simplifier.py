@@ -0,0 +1,253 @@
+from parser import Literal, Concat, Alternation, Star, Plus, Group, Epsilon, flatten_concat
+
+class _TrieNode:
+    __slots__ = ('children', 'end')
+    def __init__(self):
+        self.children = {}
+        self.end = False
+
+class Simplifier:
+    def __init__(self, factor_prefixes=True):
+        """
+        Pasada de optimización sobre el AST del parser previa a la construcción
+        del DFA. Todos los nodos se construyen mediante constructores
+        "inteligentes" que:
+          - comparten (hash-consing) los subárboles idénticos, de modo que dos
+            subexpresiones iguales son el mismo objeto;
+          - eliminan ramas duplicadas de una alternancia y las ordenan de
+            forma canónica (las de un solo carácter primero, como una clase);
+          - pliegan x**, (x?)*, (x+)*, (x*)+ y las concatenaciones con ε;
+          - factorizan los prefijos comunes de las alternativas (salvo con
+            factor_prefixes=False, en cuyo caso la alternancia solo se
+            normaliza respecto a asociatividad, conmutatividad e idempotencia).
+        Menos hojas significan menos posiciones en DFA.compute_functions.
+        """
+        self.factor_prefixes = factor_prefixes
+        self._table = {}
+        self.epsilon = Epsilon()
+        self._serial = {id(self.epsilon): 0}
+
+    def _intern(self, key, factory):
+        """
+        Retorna el nodo único para `key`. Cada nodo nuevo recibe un número de
+        serie creciente, que da un orden determinista entre nodos.
+        """
+        node = self._table.get(key)
+        if node is None:
+            node = factory()
+            self._table[key] = node
+            self._serial[id(node)] = len(self._serial)
+        return node
+
+    def literal(self, value, escaped=False):
+        if value == "ε" and not escaped:
+            return self.epsilon
+        return self._intern(('lit', value, escaped), lambda: Literal(value, escaped))
+
+    def concat(self, left, right):
+        """
+        Concatenación normalizada como cadena asociada a la izquierda y sin ε.
+        """
+        if left is self.epsilon:
+            return right
+        if right is self.epsilon:
+            return left
+        for item in flatten_concat(right):
+            left = self._intern(('·', id(left), id(item)),
+                                lambda: Concat(left, item))
+        return left
+
+    def concat_all(self, items):
+        node = self.epsilon
+        for item in items:
+            node = self.concat(node, item)
+        return node
+
+    def star(self, child):
+        if child is self.epsilon:
+            return child
+        if isinstance(child, Star):
+            return child
+        if isinstance(child, Plus):
+            child = child.child
+        if isinstance(child, Concat):
+            # (x·x*)* es la forma expandida de (x+)* por el preprocesador.
+            items = flatten_concat(child)
+            if len(items) == 2 and isinstance(items[1], Star) and items[1].child is items[0]:
+                return items[1]
+        if isinstance(child, Alternation):
+            # (x?)* = x* y (x*|y)* = (x|y)*: dentro de una clausura sobran ε
+            # y las clausuras de las ramas.
+            branches = []
+            changed = False
+            for branch in self._branches(child):
+                if branch is self.epsilon:
+                    changed = True
+                elif isinstance(branch, (Star, Plus)):
+                    branches.append(branch.child)
+                    changed = True
+                else:
+                    branches.append(branch)
+            if changed:
+                child = self.alternation_all(branches)
+                if child is self.epsilon or isinstance(child, Star):
+                    return child
+        return self._intern(('*', id(child)), lambda: Star(child))
+
+    def plus(self, child):
+        if child is self.epsilon or isinstance(child, (Star, Plus)):
+            return child
+        return self._intern(('+', id(child)), lambda: Plus(child))
+
+    def alternation(self, left, right):
+        return self.alternation_all([left, right])
+
+    def alternation_all(self, branches):
+        """
+        Alternancia normalizada: aplana las alternancias anidadas, descarta
+        ramas duplicadas, factoriza prefijos comunes y coloca primero las
+        alternativas de un solo carácter en orden (una clase de caracteres).
+        """
+        if not self.factor_prefixes:
+            return self._combine(branches)
+        return self._from_trie(self._build_trie(self._unique_branches(branches)))
+
+    def _unique_branches(self, branches):
+        unique = []
+        seen = set()
+        for node in branches:
+            for branch in self._branches(node):
+                if id(branch) not in seen:
+                    seen.add(id(branch))
+                    unique.append(branch)
+        if self.epsilon in unique and any(isinstance(b, Star) for b in unique):
+            unique.remove(self.epsilon)
+        return unique
+
+    def _build_trie(self, branches):
+        """
+        Trie sobre los factores de cada rama (listas de flatten_concat): las
+        ramas con el mismo primer nodo comparten camino, ab|ac → a(b|c).
+        """
+        root = _TrieNode()
+        for branch in branches:
+            node = root
+            if branch is not self.epsilon:
+                for item in flatten_concat(branch):
+                    entry = node.children.get(id(item))
+                    if entry is None:
+                        entry = (item, _TrieNode())
+                        node.children[id(item)] = entry
+                    node = entry[1]
+            node.end = True
+        return root
+
+    @staticmethod
+    def _chain(item, node):
+        """
+        Sigue el camino sin bifurcaciones que empieza en `item` y retorna sus
+        factores y el nodo del trie donde termina (fin de rama o bifurcación).
+        """
+        items = [item]
+        while not node.end and len(node.children) == 1:
+            item, node = next(iter(node.children.values()))
+            items.append(item)
+        return items, node
+
+    def _from_trie(self, root):
+        """
+        Reconstruye la alternancia factorizada en postorden con pila explícita,
+        de modo que los prefijos largos no agotan la pila de Python.
+        """
+        results = {}
+        stack = [(root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not visited:
+                stack.append((node, True))
+                for item, child in node.children.values():
+                    stack.append((self._chain(item, child)[1], False))
+                continue
+            branches = [self.epsilon] if node.end else []
+            for item, child in node.children.values():
+                items, tail = self._chain(item, child)
+                branches.append(self.concat(self.concat_all(items), results.pop(id(tail))))
+            results[id(node)] = self._combine(branches)
+        return results[id(root)]
+
+    def _combine(self, branches):
+        """
+        Encadena ramas ya factorizadas sin duplicados y en un orden canónico:
+        primero los caracteres sueltos en orden y luego el resto por número
+        de serie. Así la alternancia queda normalizada respecto a
+        asociatividad, conmutatividad e idempotencia: dos alternancias con
+        las mismas ramas son el mismo nodo.
+        """
+        unique = self._unique_branches(branches)
+        chars = sorted((b for b in unique if isinstance(b, Literal)),
+                       key=lambda b: (b.value, b.escaped))
+        serial = self._serial
+        others = sorted((b for b in unique if not isinstance(b, Literal)),
+                        key=lambda b: serial[id(b)])
+        ordered = chars + others
+        node = ordered[0]
+        for branch in ordered[1:]:
+            node = self._intern(('|', id(node), id(branch)),
+                                lambda: Alternation(node, branch))
+        return node
+
+    @staticmethod
+    def _branches(node):
+        result = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, Alternation):
+                stack.append(current.right)
+                stack.append(current.left)
+            else:
+                result.append(current)
+        return result
+
+    def simplify(self, node):
+        """
+        Reconstruye el AST en postorden (con pila explícita) usando los
+        constructores normalizadores. Los nodos Group desaparecen, ya que
+        solo reflejan los paréntesis de la expresión original.
+        """
+        results = []
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if isinstance(current, Literal):
+                results.append(self.literal(current.value, current.escaped))
+            elif isinstance(current, Epsilon):
+                results.append(self.epsilon)
+            elif not visited:
+                stack.append((current, True))
+                if isinstance(current, (Concat, Alternation)):
+                    stack.append((current.right, False))
+                    stack.append((current.left, False))
+                elif isinstance(current, (Star, Plus, Group)):
+                    stack.append((current.child, False))
+                else:
+                    raise ValueError("Unknown node type in simplification")
+            elif isinstance(current, Concat):
+                right = results.pop()
+                results.append(self.concat(results.pop(), right))
+            elif isinstance(current, Alternation):
+                right = results.pop()
+                results.append(self.alternation(results.pop(), right))
+            elif isinstance(current, Star):
+                results.append(self.star(results.pop()))
+            elif isinstance(current, Plus):
+                results.append(self.plus(results.pop()))
+            else:
+                pass  # Group: el resultado del hijo queda en la pila.
+        return results.pop()
+
+def simplify(ast):
+    """
+    Devuelve una versión simplificada y con subárboles compartidos del AST.
+    """
+    return Simplifier().simplify(ast)
@@ -1,4 +1,6 @@
 class Symbol:
+    __slots__ = ('name', 'type')
+
     def __init__(self, name, symbol_type):
         self.name = name
         self.type = symbol_type
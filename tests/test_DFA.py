@@ -3,7 +3,7 @@ from parser import parse_regex, to_postfix
 from preprocessor import preprocess_expression
 from symbol import Symbol
 from arbolSINT import SyntaxTree
-from DFA import DFA
+from DFA import DFA, CompileLimits, StateExplosionError
 
 def simulate_dfa(dfa, input_string):
     """
@@ -19,7 +19,7 @@ def simulate_dfa(dfa, input_string):
     return current_state in dfa.final_states
 
 class TestDFA(unittest.TestCase):
-    def build_dfa(self, regex):
+    def build_dfa(self, regex, limits=None):
         preprocessed = preprocess_expression(regex)
         ast = parse_regex(preprocessed)
         postfix = to_postfix(ast)
@@ -34,7 +34,7 @@ class TestDFA(unittest.TestCase):
             else:
                 tokens.append(Symbol(token, "operand"))
         st = SyntaxTree(tokens)
-        return DFA(st)
+        return DFA(st, limits)
 
     def test_dfa_accepts_a(self):
         dfa = self.build_dfa("a")
@@ -47,5 +47,29 @@ class TestDFA(unittest.TestCase):
         self.assertFalse(simulate_dfa(dfa, "a"))
         self.assertFalse(simulate_dfa(dfa, "b"))
 
+    def test_dfa_deep_tree(self):
+        # Una alternancia larga produce un árbol sintáctico con profundidad lineal.
+        dfa = self.build_dfa("|".join("a" * 3000))
+        self.assertTrue(simulate_dfa(dfa, "a"))
+        self.assertFalse(simulate_dfa(dfa, "aa"))
+
+    def test_state_budget(self):
+        regex = "(a|b)*a" + "(a|b)" * 10
+        with self.assertRaises(StateExplosionError) as ctx:
+            self.build_dfa(regex, CompileLimits(max_states=100))
+        self.assertEqual(ctx.exception.limit, "max_states")
+        self.assertEqual(ctx.exception.maximum, 100)
+        self.assertGreater(ctx.exception.observed, 100)
+        with self.assertRaises(StateExplosionError) as ctx:
+            self.build_dfa(regex, CompileLimits(max_memory=10000))
+        self.assertEqual(ctx.exception.limit, "max_memory")
+        with self.assertRaises(StateExplosionError) as ctx:
+            # Solo followpos ya supera el presupuesto de memoria.
+            self.build_dfa("ab", CompileLimits(max_memory=100))
+        self.assertEqual(ctx.exception.stage, "subset construction")
+        self.assertEqual(ctx.exception.limit, "max_memory")
+        dfa = self.build_dfa("(a|b)*abb", CompileLimits(max_states=100, max_time=5))
+        self.assertTrue(simulate_dfa(dfa, "aabb"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -22,5 +22,10 @@ class TestSyntaxTree(unittest.TestCase):
         # El hijo derecho de la raíz es el nodo EOF
         self.assertEqual(st.root.right.value, "☒")
 
+    def test_tree_node_has_no_instance_dict(self):
+        node = TreeNode("a")
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertIsNone(node.pos)
+
 if __name__ == '__main__':
     unittest.main()
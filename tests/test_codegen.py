@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from parser import parse_regex, to_postfix
+from preprocessor import preprocess_expression
+from simplifier import simplify
+from core import tokenize_postfix, simulate_dfa
+from arbolSINT import SyntaxTree
+from DFA import DFA
+from MinimizedDFA import MinimizedDFA
+from codegen import generate_source, compile_matcher, save_matcher, load_matcher
+
+class TestCodegen(unittest.TestCase):
+    def build_min_dfa(self, regex):
+        ast = simplify(parse_regex(preprocess_expression(regex)))
+        tokens = tokenize_postfix(to_postfix(ast))
+        return MinimizedDFA(DFA(SyntaxTree(tokens)))
+
+    def test_matches_simulation(self):
+        regex = "[ae03]+@[ae03]+\\.(com|net|org)(\\.(gt|cr|co))?"
+        min_dfa = self.build_min_dfa(regex)
+        match = compile_matcher(min_dfa)
+        for text in ["a@e.com", "ae03@0.net.gt", "a@e.co", "@e.com", "a@e.org.", "", "a0@3e.org.cr"]:
+            self.assertEqual(match(text), simulate_dfa(min_dfa, text, minimized=True), text)
+
+    def test_self_loop_state(self):
+        min_dfa = self.build_min_dfa("((a|b)|(a|b))*abb")
+        match = compile_matcher(min_dfa, name="ends_abb")
+        self.assertTrue(match("abababb"))
+        self.assertTrue(match("abb"))
+        self.assertFalse(match("abba"))
+        self.assertFalse(match("abc"))
+        self.assertIn("def ends_abb(s):", generate_source(min_dfa, name="ends_abb"))
+
+    def test_long_runs(self):
+        min_dfa = self.build_min_dfa("[ae03]+@[ae03]+\\.(com|net|org)")
+        match = compile_matcher(min_dfa)
+        self.assertIn("re.compile('[03ae]*').match", generate_source(min_dfa))
+        self.assertTrue(match("ae03" * 1000 + "@" + "0" * 1000 + ".org"))
+        self.assertFalse(match("ae03" * 1000 + "@" + "0" * 1000))
+        self.assertFalse(match("ae03" * 1000 + "x@0.org"))
+
+    def test_short_runs(self):
+        min_dfa = self.build_min_dfa("((a|b)|(a|b))*abb")
+        match = compile_matcher(min_dfa)
+        for text in ["ab" * 50 + "b", "ba" * 50 + "bb", "aabb" * 20, "abb" * 10 + "a", "b", "abbb", "aab"]:
+            self.assertEqual(match(text), simulate_dfa(min_dfa, text, minimized=True), text)
+
+    def test_many_states(self):
+        min_dfa = self.build_min_dfa("ab" * 1500)
+        match = compile_matcher(min_dfa)
+        self.assertTrue(match("ab" * 1500))
+        self.assertFalse(match("ab" * 1499 + "aa"))
+        self.assertFalse(match("ab" * 1499))
+
+    def test_many_targets(self):
+        regex = "ax|by|cz|dw|ev|fu|gt|hs|ir|jq"
+        min_dfa = self.build_min_dfa(regex)
+        match = compile_matcher(min_dfa)
+        self.assertIn("_match_next_0 = {", generate_source(min_dfa))
+        for text in ["ax", "jq", "hs", "ay", "", "a", "axx", "q"]:
+            self.assertEqual(match(text), simulate_dfa(min_dfa, text, minimized=True), text)
+
+    def test_save_and_load(self):
+        min_dfa = self.build_min_dfa("if|else")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "keyword_matcher.py")
+            save_matcher(min_dfa, path, name="is_keyword")
+            is_keyword = load_matcher(path, name="is_keyword")
+        self.assertTrue(is_keyword("if"))
+        self.assertTrue(is_keyword("else"))
+        self.assertFalse(is_keyword("iff"))
+
+if __name__ == '__main__':
+    unittest.main()
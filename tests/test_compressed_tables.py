@@ -0,0 +1,60 @@
+import unittest
+from parser import parse_regex, to_postfix
+from simplifier import simplify
+from core import tokenize_postfix, compile_expression, simulate_dfa
+from arbolSINT import SyntaxTree
+from DFA import DFA
+from MinimizedDFA import MinimizedDFA
+from compressed_tables import compress, compression_stats, REPRESENTATIONS
+
+TEXTS = ["Abc1", "abc", "A", "Z9z", "AB-C", "", "Q" * 50 + "x0", "a@e.com", "ae@03.org", "a@e"]
+
+def cjk_dfa():
+    # Dos clases de 300 ideogramas; se arma sin el preprocesador.
+    first = "|".join(chr(cp) for cp in range(0x4E00, 0x4E00 + 300))
+    second = "|".join(chr(cp) for cp in range(0x6000, 0x6000 + 300))
+    ast = simplify(parse_regex(f"({first})({second})*"))
+    return MinimizedDFA(DFA(SyntaxTree(tokenize_postfix(to_postfix(ast)))))
+
+class TestCompressedTables(unittest.TestCase):
+    def test_representations_match_simulation(self):
+        for regex in ["[A-Z]+[a-z]*[0-9]?", "[ae03]+@[ae03]+\\.(com|net|org)", "if|else"]:
+            min_dfa, _ = compile_expression(regex)
+            expected = [simulate_dfa(min_dfa, t, minimized=True) for t in TEXTS]
+            for policy in ["dense", "comb", "intervals", "speed", "size"]:
+                table = compress(min_dfa, policy)
+                self.assertEqual([table.match(t) for t in TEXTS], expected, (regex, policy))
+
+    def test_stats(self):
+        min_dfa, _ = compile_expression("[A-Z]+[a-z]*[0-9]?")
+        table = compress(min_dfa, "size")
+        stats = compression_stats(table, min_dfa)
+        self.assertEqual(stats["kind"], "comb")
+        self.assertLess(stats["ratio"], 0.5)
+        dense = compression_stats(compress(min_dfa, "dense"), min_dfa)
+        self.assertEqual(dense["ratio"], 1.0)
+
+    def test_sparse_alphabet(self):
+        min_dfa, _ = compile_expression("(A|€|😀)(x|y)*")
+        comb = compress(min_dfa, "comb")
+        dense = compress(min_dfa, "dense")
+        self.assertLessEqual(comb.cells(), dense.cells())
+        for text in ["A", "€xy", "😀yyx", "x", "Az", ""]:
+            self.assertEqual(comb.match(text), simulate_dfa(min_dfa, text, minimized=True), text)
+
+    def test_policies_never_exceed_dense(self):
+        min_dfa = cjk_dfa()
+        sizes = {kind: compress(min_dfa, kind).cells() for kind in REPRESENTATIONS}
+        self.assertEqual(compress(min_dfa, "size").cells(), min(sizes.values()))
+        self.assertLessEqual(compress(min_dfa, "speed").cells(), sizes["dense"])
+        table = compress(min_dfa, "comb")
+        self.assertTrue(table.match(chr(0x4E05) + chr(0x6001) * 3))
+        self.assertFalse(table.match(chr(0x6001)))
+
+    def test_unknown_policy(self):
+        min_dfa, _ = compile_expression("a")
+        with self.assertRaises(ValueError):
+            compress(min_dfa, "smallest")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Presupuesto opcional (segundos) para importar el núcleo en un proceso
+# nuevo: el tiempo de reloj depende de la máquina, así que solo se exige
+# cuando se define CORE_IMPORT_BUDGET; si no, solo se informa la medición.
+IMPORT_BUDGET = os.environ.get("CORE_IMPORT_BUDGET")
+
+def import_in_subprocess(module):
+    code = ("import sys, time; started = time.perf_counter(); "
+            f"import {module}; "
+            "print(time.perf_counter() - started, 'graphviz' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    elapsed, graphviz_loaded = result.stdout.split()
+    return float(elapsed), graphviz_loaded == "True"
+
+class TestCore(unittest.TestCase):
+    def test_core_is_headless(self):
+        elapsed, graphviz_loaded = import_in_subprocess("core")
+        self.assertFalse(graphviz_loaded)
+        if IMPORT_BUDGET is not None:
+            self.assertLess(elapsed, float(IMPORT_BUDGET))
+        else:
+            sys.stderr.write(f"\ncore import time: {elapsed:.3f}s\n")
+
+    def test_server_is_headless(self):
+        _, graphviz_loaded = import_in_subprocess("server")
+        self.assertFalse(graphviz_loaded)
+
+if __name__ == '__main__':
+    unittest.main()
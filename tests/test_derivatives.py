@@ -0,0 +1,59 @@
+import unittest
+from parser import parse_regex
+from preprocessor import preprocess_expression
+from core import compile_expression, simulate_dfa
+from derivatives import DerivativeDFA
+from DFA import DFA, CompileLimits, StateExplosionError
+from MinimizedDFA import MinimizedDFA
+
+class TestDerivativeDFA(unittest.TestCase):
+    def test_matches_positions_engine(self):
+        texts = ["a@e.com", "a@e.co", "abb", "babb", "abba", "xxy", "y", "if", "else", "", "abcabc", "abd"]
+        for regex in ["[ae03]+@[ae03]+\\.(com|net|org)", "((a|b)|(a|b))*abb", "x+y?", "if|else",
+                      "{abc}+", "(ab|ac)*d?", "a?"]:
+            by_positions, _ = compile_expression(regex)
+            by_derivatives, _ = compile_expression(regex, engine="derivatives")
+            self.assertEqual(len(by_derivatives.minimized_states), len(by_positions.minimized_states), regex)
+            for text in texts:
+                self.assertEqual(simulate_dfa(by_derivatives, text, minimized=True),
+                                 simulate_dfa(by_positions, text, minimized=True), (regex, text))
+
+    def test_minimal(self):
+        ast = parse_regex(preprocess_expression("((a|b)|(a|b))*abb((a|b)|(a|b))*"))
+        dfa = DerivativeDFA(ast)
+        self.assertTrue(simulate_dfa(dfa, "aabbab"))
+        self.assertFalse(simulate_dfa(dfa, "abab"))
+        self.assertLessEqual(len(dfa.transitions), 6)
+        for k in range(4, 9):
+            dfa = DerivativeDFA(parse_regex("(a|b)*a" + "(a|b)" * k))
+            self.assertEqual(len(dfa.transitions), 2 ** (k + 1), k)
+            self.assertEqual(len(dfa.transitions), len(MinimizedDFA(dfa).minimized_states), k)
+
+    def test_long_concatenation(self):
+        dfa = DerivativeDFA(parse_regex("ab" * 300))
+        self.assertEqual(len(dfa.transitions), 601)
+        self.assertTrue(simulate_dfa(dfa, "ab" * 300))
+        self.assertFalse(simulate_dfa(dfa, "ab" * 299))
+
+    def test_limits(self):
+        ast = parse_regex("(a|b)*a" + "(a|b)" * 10)
+        with self.assertRaises(StateExplosionError) as ctx:
+            DerivativeDFA(ast, CompileLimits(max_states=50))
+        self.assertEqual(ctx.exception.stage, "derivative construction")
+        with self.assertRaises(StateExplosionError) as ctx:
+            DerivativeDFA(ast, CompileLimits(max_memory=4096))
+        self.assertEqual(ctx.exception.limit, "max_memory")
+
+    def test_interface(self):
+        dfa = DerivativeDFA(parse_regex("ab*"))
+        self.assertNotIsInstance(dfa, DFA)
+        self.assertFalse(hasattr(dfa, "nullable"))
+        self.assertEqual(dfa.eof_symbol, '☒')
+        self.assertIn(dfa.start_state, dfa.transitions)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            compile_expression("a", engine="nfa")
+
+if __name__ == '__main__':
+    unittest.main()
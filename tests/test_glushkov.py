@@ -0,0 +1,41 @@
+import random
+import unittest
+from core import build_syntax_tree, compile_expression, simulate_dfa
+from glushkov import GlushkovMatcher
+from nfa import PositionNFA
+
+class TestGlushkovMatcher(unittest.TestCase):
+    def test_matches_dfa(self):
+        for regex in ["[ae03]+@[ae03]+\\.(com|net|org)", "((a|b)|(a|b))*abb", "x+y?", "if|else",
+                      "{abcdefghij}+(klmnop|qrstuv)"]:
+            _, syntax_tree = build_syntax_tree(regex)
+            matcher = GlushkovMatcher(syntax_tree)
+            min_dfa, _ = compile_expression(regex)
+            for text in ["a@e.com", "a@e.co", "abb", "babb", "abba", "xxy", "y", "if", "else", "",
+                         "abcdefghijklmnop", "abcdefghijabcdefghijqrstuv", "abcdefghijqrst"]:
+                self.assertEqual(matcher.match(text), simulate_dfa(min_dfa, text, minimized=True), (regex, text))
+
+    def test_agrees_with_position_nfa(self):
+        # Muchas distancias de arista distintas: la mayoría van a la tabla de excepciones.
+        patterns = ["(a|bc|def|ghij)*(a|b)(c|d)", "{ab}+{cde}+{fghi}+(a|b)*j",
+                    "(a|b)*a" + "(a|b)" * 40, "{abcd}+" * 50]
+        rng = random.Random(7)
+        for regex in patterns:
+            _, syntax_tree = build_syntax_tree(regex)
+            matcher = GlushkovMatcher(syntax_tree)
+            nfa = PositionNFA(syntax_tree)
+            alphabet = sorted(nfa.symbol_positions)
+            texts = ["abcd" * 50, "a" + "b" * 40, "abcdefghij", "ababcdefghij"]
+            texts += ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+                      for _ in range(200)]
+            for text in texts:
+                self.assertEqual(matcher.match(text), nfa.match(text), (regex, text))
+
+    def test_exponential_pattern(self):
+        _, syntax_tree = build_syntax_tree("(a|b)*a" + "(a|b)" * 20)
+        matcher = GlushkovMatcher(syntax_tree)
+        self.assertTrue(matcher.match("b" * 50 + "a" + "b" * 20))
+        self.assertFalse(matcher.match("b" * 50 + "a" + "b" * 19))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ from parser import parse_regex, to_postfix
 from preprocessor import preprocess_expression
 from symbol import Symbol
 from arbolSINT import SyntaxTree
-from DFA import DFA
+from DFA import DFA, CompileLimits, StateExplosionError
 from MinimizedDFA import MinimizedDFA
 
 def simulate_dfa(dfa, input_string, minimized=False):
@@ -26,7 +26,7 @@ def simulate_dfa(dfa, input_string, minimized=False):
     return current_state in final_states
 
 class TestMinimizedDFA(unittest.TestCase):
-    def build_min_dfa(self, regex):
+    def build_min_dfa(self, regex, limits=None):
         preprocessed = preprocess_expression(regex)
         ast = parse_regex(preprocessed)
         postfix = to_postfix(ast)
@@ -41,7 +41,7 @@ class TestMinimizedDFA(unittest.TestCase):
                 tokens.append(Symbol(token, "operand"))
         st = SyntaxTree(tokens)
         dfa = DFA(st)
-        return MinimizedDFA(dfa)
+        return MinimizedDFA(dfa, limits)
 
     def test_minimized_dfa_accepts_a(self):
         min_dfa = self.build_min_dfa("a")
@@ -54,5 +54,17 @@ class TestMinimizedDFA(unittest.TestCase):
         self.assertFalse(simulate_dfa(min_dfa, "a", minimized=True))
         self.assertFalse(simulate_dfa(min_dfa, "b", minimized=True))
 
+    def test_minimization_budget(self):
+        regex = "(a|b)*a" + "(a|b)" * 6
+        for limits, limit in [(CompileLimits(max_states=20), "max_states"),
+                              (CompileLimits(max_transitions=50), "max_transitions"),
+                              (CompileLimits(max_memory=2000), "max_memory")]:
+            with self.assertRaises(StateExplosionError) as ctx:
+                self.build_min_dfa(regex, limits)
+            self.assertEqual(ctx.exception.stage, "minimization")
+            self.assertEqual(ctx.exception.limit, limit)
+        min_dfa = self.build_min_dfa(regex, CompileLimits(max_states=200, max_time=5))
+        self.assertTrue(simulate_dfa(min_dfa, "a" + "b" * 6, minimized=True))
+
 if __name__ == '__main__':
     unittest.main()
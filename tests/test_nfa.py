@@ -0,0 +1,29 @@
+import unittest
+from core import build_syntax_tree, compile_expression, simulate_dfa
+from nfa import PositionNFA
+from glushkov import GlushkovMatcher
+
+class TestPositionNFA(unittest.TestCase):
+    def test_matches_dfa(self):
+        for regex in ["[ae03]+@[ae03]+\\.(com|net|org)", "((a|b)|(a|b))*abb", "x+y?", "if|else"]:
+            _, syntax_tree = build_syntax_tree(regex)
+            nfa = PositionNFA(syntax_tree)
+            min_dfa, _ = compile_expression(regex)
+            for text in ["a@e.com", "a@e.co", "abb", "babb", "abba", "xxy", "y", "if", "else", ""]:
+                self.assertEqual(nfa.match(text), simulate_dfa(min_dfa, text, minimized=True), (regex, text))
+
+    def test_agrees_with_glushkov(self):
+        _, syntax_tree = build_syntax_tree("{abcdefghij}+(klmnop|qrstuv)")
+        nfa = PositionNFA(syntax_tree)
+        matcher = GlushkovMatcher(syntax_tree)
+        for text in ["abcdefghijklmnop", "abcdefghijabcdefghijqrstuv", "abcdefghijqrst", ""]:
+            self.assertEqual(nfa.match(text), matcher.match(text), text)
+
+    def test_exponential_pattern(self):
+        _, syntax_tree = build_syntax_tree("(a|b)*a" + "(a|b)" * 20)
+        nfa = PositionNFA(syntax_tree)
+        self.assertTrue(nfa.match("b" * 50 + "a" + "b" * 20))
+        self.assertFalse(nfa.match("b" * 50 + "a" + "b" * 19))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,5 +26,16 @@ class TestParser(unittest.TestCase):
         postfix = to_postfix(ast)
         self.assertEqual(postfix, "a a * ·")
 
+    def test_deep_nesting(self):
+        depth = 5000
+        expr = "(" * depth + "a|b" + ")" * depth + "*"
+        ast = parse_regex(expr)
+        postfix = to_postfix(ast)
+        self.assertEqual(postfix, "a b | *")
+
+    def test_unbalanced_group(self):
+        with self.assertRaises(ValueError):
+            parse_regex("(a|b")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from parser import parse_regex, to_postfix
+from preprocessor import preprocess_expression
+from simplifier import simplify
+from core import tokenize_postfix, simulate_dfa
+from arbolSINT import SyntaxTree
+from DFA import DFA
+from MinimizedDFA import MinimizedDFA
+from prefilter import Prefilter, MAX_FACTOR
+
+class TestPrefilter(unittest.TestCase):
+    def build(self, regex):
+        ast = simplify(parse_regex(preprocess_expression(regex)))
+        min_dfa = MinimizedDFA(DFA(SyntaxTree(tokenize_postfix(to_postfix(ast)))))
+        return min_dfa, Prefilter.from_ast(ast)
+
+    def test_required_factors(self):
+        _, prefilter = self.build("[ae03]+@[ae03]+\\.(com|net|org)")
+        self.assertEqual(set(prefilter.factors), {"@", "."})
+        self.assertEqual(prefilter.min_length, 7)
+        self.assertIsNone(prefilter.max_length)
+        self.assertFalse(prefilter.admits("a3e0.com"))
+        self.assertFalse(prefilter.admits(b"a3e0@com"))
+        self.assertTrue(prefilter.admits("a@e.com"))
+
+    def test_length_bounds(self):
+        _, prefilter = self.build("abc|abd|ab")
+        self.assertEqual(prefilter.factors, ("ab",))
+        self.assertEqual((prefilter.min_length, prefilter.max_length), (2, 3))
+        self.assertFalse(prefilter.admits("abcd"))
+        self.assertFalse(prefilter.admits("a"))
+
+    def test_long_literal(self):
+        text = "ab" * 16000
+        prefilter = Prefilter.from_ast(simplify(parse_regex(text)))
+        self.assertEqual(prefilter.factors, (text[:MAX_FACTOR],))
+        self.assertEqual((prefilter.min_length, prefilter.max_length), (32000, 32000))
+        self.assertTrue(prefilter.admits(text))
+        self.assertFalse(prefilter.admits("ac" * 16000))
+
+    def test_simulation_with_prefilter(self):
+        min_dfa, prefilter = self.build("((a|b)|(a|b))*abb((a|b)|(a|b))*")
+        for text in ["abb", "aabbab", "abab", "", "bbbabba"]:
+            expected = simulate_dfa(min_dfa, text, minimized=True)
+            self.assertEqual(simulate_dfa(min_dfa, text, minimized=True, prefilter=prefilter), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+import server
+from server import MatchService, start_server, match_batch, get_matcher, cached_matcher
+from DFA import CompileLimits
+
+EMAIL = "[ae03]+@[ae03]+\\.(com|net|org)"
+
+class TestGetMatcher(unittest.TestCase):
+    def test_falls_back_when_budget_exceeded(self):
+        regex = "(a|b)*a" + "(a|b)" * 12
+        match = get_matcher(regex, limits=CompileLimits(max_states=50))
+        self.assertTrue(match("ab" * 10 + "a" + "b" * 12))
+        self.assertFalse(match("a" * 5 + "b" * 13))
+
+    def test_falls_back_when_codegen_fails(self):
+        with mock.patch.object(server, "compile_matcher", side_effect=RecursionError):
+            match = get_matcher("(ab)+c", limits=None)
+        self.assertTrue(match("ababc"))
+        self.assertFalse(match("abac"))
+
+    def test_cache_is_keyed_on_limits(self):
+        regex = "(a|b)*a(a|b)(a|b)"
+        default = get_matcher(regex)
+        self.assertIs(get_matcher(regex), default)
+        limited = get_matcher(regex, limits=CompileLimits(max_states=4))
+        self.assertIsNot(limited, default)
+        self.assertIs(get_matcher(regex, limits=CompileLimits(max_states=4)), limited)
+        self.assertIs(cached_matcher(regex, limits=CompileLimits(max_states=4)), limited)
+
+    def test_cache_is_bounded(self):
+        with mock.patch.object(server, "CACHE_SIZE", 2):
+            first = get_matcher("lru1")
+            get_matcher("lru2")
+            self.assertIs(get_matcher("lru1"), first)
+            get_matcher("lru3")
+            self.assertIsNone(cached_matcher("lru2"))
+            self.assertIs(cached_matcher("lru1"), first)
+            self.assertLessEqual(len(server._compiled), 2)
+
+    def test_batch_errors_are_per_item(self):
+        results = match_batch(EMAIL, ["a@e.com", None, "a@e"])
+        self.assertEqual(results[0], True)
+        self.assertIsInstance(results[1], TypeError)
+        self.assertEqual(results[2], False)
+        errors = match_batch("(a", ["a", "b"])
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+class TestMatchService(unittest.IsolatedAsyncioTestCase):
+    async def test_coalesces_concurrent_requests(self):
+        service = MatchService(batch_delay=0.01)
+        service.start()
+        try:
+            texts = ["a@e.com", "a@e.co", "03@ae.org", "@e.net"] * 10
+            results = await asyncio.gather(*(service.match(EMAIL, t) for t in texts))
+        finally:
+            await service.close()
+        self.assertEqual(results, match_batch(EMAIL, texts))
+        self.assertEqual(service.stats["requests"], len(texts))
+        self.assertLess(service.stats["batches"], len(texts))
+
+    async def test_compiles_off_the_loop(self):
+        threads = []
+        original = server.get_matcher
+
+        def recording_get_matcher(expr, *args):
+            threads.append(threading.current_thread())
+            return original(expr, *args)
+
+        service = MatchService(batch_delay=0.01)
+        service.start()
+        try:
+            with mock.patch.object(server, "get_matcher", recording_get_matcher):
+                texts = ["xyz", "xy", "xyzz"] * 5
+                results = await asyncio.gather(*(service.match("xyz+", t) for t in texts))
+        finally:
+            await service.close()
+        self.assertEqual(results, [True, False, True] * 5)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    async def test_rejects_non_string_requests(self):
+        service = MatchService(batch_delay=0.01)
+        service.start()
+        try:
+            with self.assertRaises(TypeError):
+                await service.match(["a"], "a")
+            with self.assertRaises(TypeError):
+                await service.match("a", 1)
+            self.assertTrue(await service.match("a", "a"))
+        finally:
+            await service.close()
+
+    async def test_batcher_survives_bad_entries(self):
+        service = MatchService(batch_delay=0.01)
+        service.start()
+        try:
+            loop = asyncio.get_running_loop()
+            bad = loop.create_future()
+            await service.queue.put(([EMAIL], "a@e.com", bad))
+            good = await service.match(EMAIL, "a@e.com")
+            with self.assertRaises(TypeError):
+                await bad
+            self.assertTrue(good)
+            self.assertFalse(await service.match(EMAIL, "a@e"))
+        finally:
+            await service.close()
+
+    async def test_close_fails_queued_requests(self):
+        service = MatchService(batch_delay=0.01)
+        waiters = [asyncio.ensure_future(service.match(EMAIL, "a@e.com")) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(service.queue.qsize(), 3)
+        await service.close()
+        for waiter in waiters:
+            with self.assertRaises(RuntimeError):
+                await asyncio.wait_for(waiter, 1)
+        with self.assertRaises(RuntimeError):
+            await service.match(EMAIL, "a@e.com")
+
+    async def test_close_fails_batch_being_collected(self):
+        service = MatchService(batch_delay=10)
+        service.start()
+        waiters = [asyncio.ensure_future(service.match(EMAIL, "a@e.com")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        self.assertEqual(service.queue.qsize(), 0)
+        await service.close()
+        for waiter in waiters:
+            with self.assertRaises(RuntimeError):
+                await asyncio.wait_for(waiter, 1)
+
+    async def test_offloads_large_batches(self):
+        service = MatchService(workers=1, batch_delay=0.01, offload_threshold=4)
+        service.start()
+        try:
+            texts = ["abb", "ab", "babb", "abba"] * 4
+            results = await asyncio.gather(*(service.match("(a|b)*abb", t) for t in texts))
+        finally:
+            await service.close()
+        self.assertEqual(results, [True, False, True, False] * 4)
+        self.assertGreaterEqual(service.stats["offloaded"], 1)
+
+    async def test_line_protocol(self):
+        service = MatchService()
+        server = await start_server(service, port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            requests = [
+                {"id": 1, "pattern": EMAIL, "input": "a@e.com"},
+                {"id": 2, "pattern": EMAIL, "input": "a@e"},
+                {"id": 3, "pattern": "(a", "input": "a"},
+                {"id": 4, "pattern": ["a"], "input": "a"},
+                {"id": 5, "pattern": "a"},
+            ]
+            for request in requests:
+                writer.write(json.dumps(request).encode("utf-8") + b"\n")
+            writer.write(b"not json\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(6)]
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.close()
+        by_id = {r["id"]: r for r in responses}
+        self.assertTrue(by_id[1]["match"])
+        self.assertFalse(by_id[2]["match"])
+        self.assertIn("error", by_id[3])
+        self.assertIn("error", by_id[4])
+        self.assertIn("error", by_id[5])
+        self.assertIn("error", by_id[None])
+
+if __name__ == '__main__':
+    unittest.main()
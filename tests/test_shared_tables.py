@@ -0,0 +1,45 @@
+import multiprocessing
+import unittest
+from core import compile_expression, simulate_dfa
+from shared_tables import export_shared, SharedDFA, dense_table
+
+TEXTS = ["a@e.com", "a03@3.net", "a@e.co", "@e.org", "", "e@e.org"]
+
+def match_in_child(name, texts):
+    view = SharedDFA(name)
+    try:
+        return [view.match(text) for text in texts]
+    finally:
+        view.close()
+
+class TestSharedTables(unittest.TestCase):
+    def setUp(self):
+        self.min_dfa, _ = compile_expression("[ae03]+@[ae03]+\\.(com|net|org)")
+        self.shm = export_shared(self.min_dfa)
+        self.expected = [simulate_dfa(self.min_dfa, t, minimized=True) for t in TEXTS]
+
+    def tearDown(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def test_dense_table(self):
+        alphabet, table, finals = dense_table(self.min_dfa)
+        self.assertEqual(len(table), len(finals) * len(alphabet))
+        self.assertEqual(len(finals), len(self.min_dfa.minimized_states))
+
+    def test_attach_same_process(self):
+        view = SharedDFA(self.shm.name)
+        try:
+            self.assertEqual([view.match(t) for t in TEXTS], self.expected)
+            with self.assertRaises(TypeError):
+                view.table[0] = 1
+        finally:
+            view.close()
+
+    def test_attach_in_worker(self):
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            result = pool.apply(match_in_child, (self.shm.name, TEXTS))
+        self.assertEqual(result, self.expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from parser import parse_regex, to_postfix
+from preprocessor import preprocess_expression
+from simplifier import simplify, Simplifier
+from core import tokenize_postfix
+from arbolSINT import SyntaxTree
+from DFA import DFA
+
+class TestSimplifier(unittest.TestCase):
+    def simplified_postfix(self, regex):
+        return to_postfix(simplify(parse_regex(preprocess_expression(regex))))
+
+    def count_positions(self, ast):
+        dfa = DFA(SyntaxTree(tokenize_postfix(to_postfix(ast))))
+        return len(dfa.pos_to_symbol)
+
+    def test_duplicate_branches(self):
+        self.assertEqual(self.simplified_postfix("(a|b)|(b|a)"), "a b |")
+
+    def test_star_folding(self):
+        self.assertEqual(self.simplified_postfix("a**"), "a *")
+        self.assertEqual(self.simplified_postfix("(a?)*"), "a *")
+        self.assertEqual(self.simplified_postfix("(a+)*"), "a *")
+
+    def test_epsilon_concatenation(self):
+        self.assertEqual(self.simplified_postfix("a·ε·b"), "a b ·")
+
+    def test_common_prefix(self):
+        self.assertEqual(self.simplified_postfix("abc|abd"), "a b c d | · ·")
+        self.assertEqual(self.simplified_postfix("ab|ac|a"), "a b c | ε | ·")
+
+    def test_long_common_prefix(self):
+        prefix = "ab" * 600
+        ast = simplify(parse_regex(prefix + "x|" + prefix + "y"))
+        self.assertEqual(self.count_positions(ast), 1203)
+
+    def test_hash_consing(self):
+        simplifier = Simplifier()
+        ast = simplifier.simplify(parse_regex("(a|b)*c(a|b)*"))
+        self.assertIs(ast.left.left, ast.right)
+
+    def test_fewer_positions(self):
+        ast = parse_regex(preprocess_expression("((a|b)|(a|b))*abb((a|b)|(a|b))*"))
+        self.assertEqual(self.count_positions(ast), 12)
+        self.assertEqual(self.count_positions(simplify(ast)), 8)
+
+if __name__ == '__main__':
+    unittest.main()
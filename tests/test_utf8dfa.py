@@ -0,0 +1,57 @@
+import unittest
+from parser import parse_regex, to_postfix
+from preprocessor import preprocess_expression
+from simplifier import simplify
+from core import tokenize_postfix, simulate_dfa
+from arbolSINT import SyntaxTree
+from DFA import DFA
+from MinimizedDFA import MinimizedDFA
+from utf8dfa import ByteDFA
+
+class TestByteDFA(unittest.TestCase):
+    def build_min_dfa(self, regex):
+        ast = simplify(parse_regex(preprocess_expression(regex)))
+        tokens = tokenize_postfix(to_postfix(ast))
+        return MinimizedDFA(DFA(SyntaxTree(tokens)))
+
+    def test_matches_simulation(self):
+        min_dfa = self.build_min_dfa("[ae03]+@[ae03]+\\.(com|net|org)")
+        byte_dfa = ByteDFA(min_dfa)
+        self.assertEqual(byte_dfa.table.typecode, "i")
+        self.assertEqual(len(byte_dfa.table), 256 * byte_dfa.num_states)
+        for text in ["a@e.com", "a03@3.net", "a@e.co", "a@@e.org", ""]:
+            expected = simulate_dfa(min_dfa, text, minimized=True)
+            self.assertEqual(byte_dfa.match(text.encode("utf-8")), expected, text)
+
+    def test_multibyte_characters(self):
+        min_dfa = self.build_min_dfa("(ñ|ó)+a€")
+        byte_dfa = ByteDFA(min_dfa)
+        self.assertTrue(byte_dfa.match("ñóña€".encode("utf-8")))
+        self.assertTrue(byte_dfa.match(memoryview("óa€".encode("utf-8"))))
+        self.assertFalse(byte_dfa.match("ñ".encode("utf-8")))
+        self.assertFalse(byte_dfa.match("ña€".encode("utf-8")[:-1]))
+        self.assertFalse(byte_dfa.match("na€".encode("utf-8")))
+
+    def test_long_runs(self):
+        min_dfa = self.build_min_dfa("((a|b)|(a|b))*abb")
+        byte_dfa = ByteDFA(min_dfa)
+        self.assertTrue(byte_dfa.skips)
+        self.assertTrue(byte_dfa.match(b"b" * 5000 + b"a" * 5000 + b"bb"))
+        self.assertFalse(byte_dfa.match(b"b" * 5000 + b"a" * 5000))
+        self.assertFalse(byte_dfa.match(b"b" * 5000 + b"c" + b"abb"))
+
+    def test_short_runs(self):
+        min_dfa = self.build_min_dfa("((a|b)|(a|b))*abb")
+        byte_dfa = ByteDFA(min_dfa)
+        for text in ["ab" * 50 + "b", "ba" * 50 + "bb", "aabb" * 20, "abb" * 10 + "a", "b", "abbb"]:
+            expected = simulate_dfa(min_dfa, text, minimized=True)
+            self.assertEqual(byte_dfa.match(text.encode("utf-8")), expected, text)
+
+    def test_unminimized_dfa(self):
+        dfa = self.build_min_dfa("ab*").original_dfa
+        byte_dfa = ByteDFA(dfa, minimized=False)
+        self.assertTrue(byte_dfa.match(b"abbb"))
+        self.assertFalse(byte_dfa.match(b"ba"))
+
+if __name__ == '__main__':
+    unittest.main()
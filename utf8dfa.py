@@ -0,0 +1,101 @@
+import re
+from array import array
+
+DEAD = -1
+NO_SKIP = (frozenset(), None)
+
+class ByteDFA:
+    def __init__(self, dfa_obj, minimized=True):
+        """
+        Recibe un objeto DFA o MinimizedDFA y construye el autómata equivalente
+        sobre bytes UTF-8, de modo que la simulación recorre directamente
+        `bytes`/`memoryview` sin decodificar la entrada.
+
+        Cada transición etiquetada con un carácter se expande en la secuencia
+        de bytes de su codificación UTF-8; los bytes intermedios de los
+        caracteres multibyte pasan por estados auxiliares (no finales) que se
+        comparten entre los caracteres con el mismo prefijo.
+
+        La tabla es un array('i') plano con 256 columnas por estado. Cada entrada
+        guarda directamente el desplazamiento de la fila destino (estado * 256),
+        o DEAD si no hay transición, para que cada paso sea una sola indexación.
+        Los estados con ciclos sobre sí mismos guardan en `skips` el conjunto
+        de bytes del ciclo y una búsqueda precompilada de esa clase que
+        consume la racha completa en C.
+        """
+        if minimized:
+            transitions = dfa_obj.minimized_transitions
+            start = dfa_obj.minimized_start
+            final_states = dfa_obj.minimized_final
+        else:
+            transitions = dfa_obj.transitions
+            start = dfa_obj.start_state
+            final_states = dfa_obj.final_states
+
+        rows = {}
+        order = [start]
+        rows[start] = 0
+        index = 0
+        while index < len(order):
+            state = order[index]
+            index += 1
+            for sym in sorted(transitions.get(state, {})):
+                target = transitions[state][sym]
+                if target not in rows:
+                    rows[target] = len(order)
+                    order.append(target)
+
+        table = [[DEAD] * 256 for _ in order]
+        for state in order:
+            for sym, target in sorted(transitions.get(state, {}).items()):
+                encoded = sym.encode("utf-8")
+                row = rows[state]
+                for byte in encoded[:-1]:
+                    if table[row][byte] == DEAD:
+                        table.append([DEAD] * 256)
+                        table[row][byte] = len(table) - 1
+                    row = table[row][byte]
+                table[row][encoded[-1]] = rows[target]
+
+        self.num_states = len(table)
+        self.table = array("i", [DEAD if t == DEAD else t * 256 for row in table for t in row])
+        self.start = rows[start] * 256
+        self.final_offsets = frozenset(rows[s] * 256 for s in order if s in final_states)
+        self.skips = {}
+        for row, entries in enumerate(table):
+            loop_bytes = bytes(b for b in range(256) if entries[b] == row)
+            if loop_bytes:
+                char_class = b"".join(re.escape(bytes([b])) for b in loop_bytes)
+                self.skips[row * 256] = (frozenset(loop_bytes),
+                                         re.compile(b"[" + char_class + b"]*").match)
+
+    def match(self, data):
+        """
+        Simula el autómata sobre una secuencia de bytes (bytes, bytearray o
+        memoryview). Retorna True si la entrada es aceptada.
+        El salto de un estado con ciclo solo se consulta al cambiar de estado,
+        y solo se invoca cuando los dos bytes siguientes pertenecen al ciclo
+        (las rachas de un byte cuestan menos por la tabla); entonces consume
+        la racha completa y se continúa byte a byte desde el byte de salida.
+        """
+        table = self.table
+        skips = self.skips
+        state = self.start
+        loop, skip = skips.get(state, NO_SKIP)
+        i = 0
+        n = len(data)
+        while i < n:
+            byte = data[i]
+            if byte in loop and i + 1 < n and data[i + 1] in loop:
+                i = skip(data, i).end()
+                if i == n:
+                    break
+                byte = data[i]
+            target = table[state + byte]
+            if target < 0:
+                return False
+            if target != state:
+                state = target
+                loop, skip = skips.get(state, NO_SKIP)
+            i += 1
+        return state in self.final_offsets